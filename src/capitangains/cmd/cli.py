@@ -36,17 +36,30 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import functools
 import logging
+import os
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from decimal import ROUND_HALF_UP, Decimal, getcontext
 from pathlib import Path
+from typing import Any
 
 from capitangains.logging import configure_logging
-from capitangains.model import IbkrStatementCsvParser, merge_models, merge_reports
+from capitangains.model import (
+    IbkrModel,
+    IbkrStatementCsvParser,
+    ParseReport,
+    merge_models,
+    merge_reports,
+)
 from capitangains.reporting import (
+    EXTRACTED_SECTIONS,
+    PERFORMANCE_SUMMARY_SECTION,
     FifoMatcher,
     FxTable,
+    RealizedLine,
     ReportBuilder,
     TradeRow,
     TransferRow,
@@ -58,12 +71,15 @@ from capitangains.reporting import (
     parse_withholding_tax,
     reconcile_with_ibkr_summary,
 )
-from capitangains.reporting.report_sink import ExcelReportSink
 
 # Monetary precision and rounding
 getcontext().prec = 28
 getcontext().rounding = ROUND_HALF_UP
 
+# Statement sections consumed by the extractors and the reconciliation step; all
+# other sections are skipped at parse time.
+CONSUMED_SECTIONS = EXTRACTED_SECTIONS | {PERFORMANCE_SUMMARY_SECTION}
+
 # Threshold for reconciliation mismatches (EUR)
 RECONCILIATION_MISMATCH_THRESHOLD = Decimal("0.05")
 
@@ -101,17 +117,134 @@ def validate_symbol_currency_uniqueness(
 def _event_sort_key(
     event: TradeRow | TransferRow,
 ) -> tuple[dt.date, int, str, int]:
-    if isinstance(event, TransferRow):
-        direction = event.direction.strip().lower()
-        priority = 0 if direction == "in" else 2
-        return (event.date, priority, "", 0)
-    elif isinstance(event, TradeRow):
+    # sort() evaluates the key once per event; trades outnumber transfers, so they
+    # are tested first.
+    if isinstance(event, TradeRow):
         # Buys before sells only as tie-break for identical timestamps.
         sub = 0 if event.quantity > 0 else 1
         return (event.date, 1, event.datetime_str, sub)
+    elif isinstance(event, TransferRow):
+        direction = event.direction.strip().lower()
+        priority = 0 if direction == "in" else 2
+        return (event.date, priority, "", 0)
     raise ValueError(f"unexpected event type: {type(event)}")
 
 
+def match_events(
+    matcher: FifoMatcher,
+    events: Sequence[TradeRow | TransferRow],
+    *,
+    year: int | None = None,
+) -> list[RealizedLine]:
+    """Feed a chronologically ordered event stream through the FIFO matcher.
+
+    Dispatch is resolved once per concrete event type through a lookup table rather
+    than via chained isinstance checks on every event; subclasses of TradeRow and
+    TransferRow are resolved with isinstance on first sight.  Returns the realized lines
+    generated by sells, in stream order.  With `year`, lines from sells in other
+    years are dropped as they are produced instead of being collected first.
+
+    Matching stays sequential on purpose: per-symbol work is a handful of Decimal
+    operations per event, far less than the cost of pickling lots and realized lines
+    across processes, and gap events must be recorded in stream order.
+    """
+    dispatch: dict[type, Callable[[Any], RealizedLine | None]] = {
+        TradeRow: matcher.ingest_trade,
+        TransferRow: matcher.ingest_transfer,
+    }
+
+    realized: list[RealizedLine] = []
+    append = realized.append
+    lookup = dispatch.get
+    for event in events:
+        ingest = lookup(type(event))
+        if ingest is None:
+            if isinstance(event, TradeRow):
+                dispatch[type(event)] = matcher.ingest_trade
+            elif isinstance(event, TransferRow):
+                dispatch[type(event)] = matcher.ingest_transfer
+            else:
+                raise ValueError(
+                    f"unexpected event type in merged stream: {type(event)}"
+                )
+            ingest = dispatch[type(event)]
+        rl = ingest(event)
+        # keep only realized lines generated from sells (in the requested year)
+        if rl is not None and (year is None or rl.sell_date.year == year):
+            append(rl)
+    return realized
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> IbkrStatementCsvParser:
+    """Return the shared statement parser; it is stateless across files."""
+    return IbkrStatementCsvParser(sections=CONSUMED_SECTIONS)
+
+
+def parse_inputs(
+    parser: IbkrStatementCsvParser, inputs: Sequence[str]
+) -> list[tuple[IbkrModel, ParseReport]]:
+    """Parse each input statement, fanning out to worker processes when there are
+    several.
+
+    Files are independent until merged, so multi-year invocations parse them in
+    parallel.  A single input is parsed in-process to avoid the spawn overhead.
+    Results are returned in input order.
+    """
+    if len(inputs) <= 1:
+        return [parser.parse_file(p) for p in inputs]
+    # Deferred import: the process pool pulls in multiprocessing, which single-file
+    # runs never need at startup.
+    from concurrent.futures import ProcessPoolExecutor
+
+    max_workers = min(len(inputs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(parser.parse_file, inputs))
+
+
+def find_reconciliation_mismatches(
+    my_totals: Mapping[str, Decimal], ibkr_totals: Mapping[str, Decimal]
+) -> list[tuple[str, Decimal, Decimal]]:
+    """Compare per-symbol realized EUR totals against IBKR's summary.
+
+    `my_totals` is a flat symbol -> realized EUR view built once by the caller, so
+    each IBKR symbol costs a single dict probe.  Returns (symbol, mine, ibkr) for
+    every symbol whose difference exceeds RECONCILIATION_MISMATCH_THRESHOLD.
+    """
+    logger = logging.getLogger(__name__)
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    tol = RECONCILIATION_MISMATCH_THRESHOLD
+    neg_tol = -tol
+    mismatches = []
+    for sym, ibkr_val in ibkr_totals.items():
+        my_val = my_totals.get(sym)
+        if my_val is None:
+            if debug:
+                logger.debug(
+                    "Reconciliation: %s - mine: N/A, IBKR: %s EUR "
+                    "(symbol not in my totals)",
+                    sym,
+                    ibkr_val,
+                )
+            continue
+        # A two-sided bound skips building the absolute value unless it is logged
+        delta = my_val - ibkr_val
+        is_ok = neg_tol <= delta <= tol
+        if debug:
+            logger.debug(
+                "Reconciliation: %s - mine: %s EUR, IBKR: %s EUR, diff: %s EUR (%s)",
+                sym,
+                my_val,
+                ibkr_val,
+                delta.copy_abs(),
+                "OK" if is_ok else "MISMATCH",
+            )
+        if not is_ok:
+            mismatches.append((sym, my_val, ibkr_val))
+    return mismatches
+
+
 def process_files(args: argparse.Namespace) -> None:
     # Get logger for this module
     logger = logging.getLogger(__name__)
@@ -121,11 +254,10 @@ def process_files(args: argparse.Namespace) -> None:
     inputs = args.input if isinstance(args.input, list) else [args.input]
     logger.info("Reading %d file(s): %s", len(inputs), ", ".join(inputs))
 
-    parser = IbkrStatementCsvParser()
+    parser = _get_parser()
     models = []
     reports = []
-    for p in inputs:
-        m, rep = parser.parse_file(p)
+    for p, (m, rep) in zip(inputs, parse_inputs(parser, inputs), strict=True):
         logger.debug(
             "Parsed %s: %d sections, %d subtables",
             p,
@@ -140,13 +272,25 @@ def process_files(args: argparse.Namespace) -> None:
     if parse_report.has_errors:
         raise SystemExit(2)
 
-    # Extract data
+    # The FX table is independent of the statements: load it on a background thread
+    # so its I/O overlaps with extraction and FIFO matching.  It is only started once
+    # parse_inputs has returned, so the worker processes are never forked while
+    # another thread is running.
+    fx_pool: ThreadPoolExecutor | None = None
+    fx_future: Future[FxTable] | None = None
+    if args.fx_table:
+        fx_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fx-load")
+        fx_future = fx_pool.submit(FxTable.from_csv, args.fx_table)
+
+    # Extract data.  Dividends, withholding and interest are only reported for the
+    # selected year, so their extractors drop other years before parsing amounts.
+    year = args.year
     trades = parse_trades_stocklike(model, asset_scope="stocks_etfs")
     transfers = parse_transfers(model)
-    dividends = parse_dividends(model)
-    withholding = parse_withholding_tax(model)
-    syep_interest = parse_syep_interest_details(model)
-    interest = parse_interest(model)
+    dividends = parse_dividends(model, year=year)
+    withholding = parse_withholding_tax(model, year=year)
+    syep_interest = parse_syep_interest_details(model, year=year)
+    interest = parse_interest(model, year=year)
 
     logger.info(
         "Extracted: %d trades, %d dividends, %d withholding, %d interest, %d transfers",
@@ -163,27 +307,23 @@ def process_files(args: argparse.Namespace) -> None:
     matcher = FifoMatcher(fix_sell_gaps=fix_sell_gaps)
 
     # Merge trades and transfers into a single chronological stream so that FIFO lot
-    # creation/consumption respects actual event ordering.
+    # creation/consumption respects actual event ordering.  Events dated after the
+    # report year cannot affect its realized lines and are left out entirely.
     # Same-date tie-break: transfer-in(0) < trades by datetime(1) < transfer-out(2).
     events: list[TradeRow | TransferRow] = [*trades, *transfers]
+    events = [e for e in events if e.date.year <= year]
     events.sort(key=_event_sort_key)
 
-    realized = []
-    for event in events:
-        if isinstance(event, TransferRow):
-            matcher.ingest_transfer(event)
-            continue
-        elif not isinstance(event, TradeRow):
-            raise ValueError(f"unexpected event type in merged stream: {type(event)}")
-
-        rl = matcher.ingest_trade(event)
-        if rl is not None:  # keep only realized lines generated from sells
-            realized.append(rl)
+    realized = match_events(matcher, events, year=year)
 
     logger.info(
-        "FIFO matching: %d trades processed, %d realized lines generated",
-        len(trades),
+        "FIFO matching: %d events processed (%d after %d skipped), "
+        "%d realized lines in %d",
+        len(events),
+        len(trades) + len(transfers) - len(events),
+        year,
         len(realized),
+        year,
     )
 
     # If auto-fix is disabled and there were unmatched sells, abort
@@ -206,18 +346,15 @@ def process_files(args: argparse.Namespace) -> None:
         raise SystemExit(2)
 
     # Build report
-    rb = ReportBuilder(year=args.year)
+    rb = ReportBuilder(year=year)
+    add_realized = rb.add_realized
     for rl in realized:
-        if rl.sell_date.year == args.year:
-            rb.add_realized(rl)
-    rb.set_dividends([d for d in dividends if d.date.year == args.year])
-    rb.set_withholding([w for w in withholding if w.date.year == args.year])
-
-    # Keep only rows with a value date in the selected year (drop CSV 'Total' lines)
-    rb.set_syep_interest(
-        [r for r in syep_interest if r.value_date and r.value_date.year == args.year]
-    )
-    rb.set_interest([i for i in interest if i.date.year == args.year])
+        add_realized(rl)
+    rb.set_dividends(dividends)
+    rb.set_withholding(withholding)
+
+    rb.set_syep_interest(syep_interest)
+    rb.set_interest(interest)
     rb.set_transfers(transfers)  # Include all transfers, not filtered by year
 
     logger.info(
@@ -229,47 +366,32 @@ def process_files(args: argparse.Namespace) -> None:
 
     # FX conversion if provided
     fx: FxTable | None = None
-    if args.fx_table:
+    if fx_pool is not None and fx_future is not None:
         try:
-            fx = FxTable.from_csv(args.fx_table)
+            fx = fx_future.result()
         except Exception as e:
             logger.exception("Failed to prepare FX conversion: %s", e)
             raise
+        finally:
+            fx_pool.shutdown()
     rb.convert_eur(fx)
 
     # Soft reconciliation
-    if len(inputs) == 1:
+    if len(inputs) == 1 and not rb.symbol_totals:
+        logger.debug("No realized lines in %d; skipping reconciliation.", year)
+    elif len(inputs) == 1:
         try:
-            ibkr_sum = reconcile_with_ibkr_summary(model)
+            ibkr_sum = reconcile_with_ibkr_summary(
+                model, symbols=rb.symbol_totals.keys()
+            )
             if ibkr_sum:
                 logger.debug(
                     "Reconciling %d symbols against IBKR summary", len(ibkr_sum)
                 )
-                mismatches = []
-                for sym, ibkr_val in ibkr_sum.items():
-                    sym_totals = rb.symbol_totals.get(sym)
-                    my_val = sym_totals.eur.realized if sym_totals else None
-                    if my_val is not None:
-                        diff = (my_val - ibkr_val).copy_abs()
-                        is_ok = diff <= RECONCILIATION_MISMATCH_THRESHOLD
-                        logger.debug(
-                            "Reconciliation: %s - mine: %s EUR, IBKR: %s EUR, "
-                            "diff: %s EUR (%s)",
-                            sym,
-                            my_val,
-                            ibkr_val,
-                            diff,
-                            "OK" if is_ok else "MISMATCH",
-                        )
-                        if diff > RECONCILIATION_MISMATCH_THRESHOLD:
-                            mismatches.append((sym, my_val, ibkr_val))
-                    else:
-                        logger.debug(
-                            "Reconciliation: %s - mine: N/A, IBKR: %s EUR "
-                            "(symbol not in my totals)",
-                            sym,
-                            ibkr_val,
-                        )
+                my_totals = {
+                    sym: totals.eur.realized for sym, totals in rb.symbol_totals.items()
+                }
+                mismatches = find_reconciliation_mismatches(my_totals, ibkr_sum)
                 if mismatches:
                     logger.warning(
                         "Reconciliation mismatches (my EUR vs IBKR EUR): %s",
@@ -286,7 +408,9 @@ def process_files(args: argparse.Namespace) -> None:
     # Determine output path
     out_path = Path(args.output) if args.output else Path(f"report_{args.year}.xlsx")
 
-    # Write outputs via sink
+    # Write outputs via sink (deferred import: openpyxl is only needed here)
+    from capitangains.reporting.report_sink import ExcelReportSink
+
     sink = ExcelReportSink(out_path=out_path, locale=args.locale)
     out_path = sink.write(rb)
     logger.info("Wrote workbook to %s", out_path)
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
 import logging
 import re
 from decimal import Decimal, InvalidOperation
 
-NUM_CLEAN_RE = re.compile(r"[,\s]")  # remove thousands separators, spaces
+# Deletes thousands separators and any Unicode whitespace (the same set as the
+# regex class [,\s]; str.isspace() has no matches above U+3000).
+_NUM_CLEAN_TABLE = str.maketrans(
+    "", "", "," + "".join(c for c in map(chr, range(0x3001)) if c.isspace())
+)
+# Already-clean numbers (the vast majority of IBKR cells) skip the cleanup path
+_PLAIN_NUM_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+_ZERO = Decimal("0")
+# IBKR null markers: silently mapped to the default by to_dec
+_SILENT_PLACEHOLDERS = frozenset({"", "-", "--"})
+# Elided or unavailable data: mapped to the default with a warning by to_dec
+_ELIDED_PLACEHOLDERS = frozenset({"...", "N/A", "n/a"})
 
 
 logger = logging.getLogger(__name__)
 
 
-def to_dec(
-    s: str | float | int | Decimal | None, default: Decimal = Decimal("0")
-) -> Decimal:
+def to_dec(s: str | float | int | Decimal | None, default: Decimal = _ZERO) -> Decimal:
     """Convert IBKR numeric strings to Decimal safely, coercing placeholders to default.
 
     Handles:
@@ -28,30 +39,41 @@ def to_dec(
         return s
     if isinstance(s, (int, float)):
         return Decimal(str(s))
+    # Unpadded null markers are common enough to skip the strip
+    if s in _SILENT_PLACEHOLDERS:
+        return default
+    # Well-formed cells share the memoized strict conversion; anything it rejects
+    # takes the lenient path below, which decides between default and logging.
+    try:
+        return _str_to_dec_strict(s)
+    except ValueError:
+        pass
 
     s_stripped = s.strip()
-    if not s_stripped:
-        return default
 
     # Silent placeholders
-    if s_stripped in {"-", "--"}:
+    if s_stripped in _SILENT_PLACEHOLDERS:
         return default
 
     # Warn on elided/missing data
-    if s_stripped in {"...", "N/A", "n/a"}:
-        logger.warning(
-            'Encountered elided/unavailable value "%s"; treating as %s.',
-            s_stripped,
-            default,
-        )
+    if s_stripped in _ELIDED_PLACEHOLDERS:
+        # Sanitized statements can elide whole columns; skip the logging call
+        # entirely when warnings are muted.
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                'Encountered elided/unavailable value "%s"; treating as %s.',
+                s_stripped,
+                default,
+            )
         return default
 
     try:
-        s_clean = NUM_CLEAN_RE.sub("", s_stripped)
+        s_clean = s_stripped.translate(_NUM_CLEAN_TABLE)
         return Decimal(s_clean)
     except InvalidOperation:
         # Log error but don't crash; return default
-        logger.error("Failed to parse number from: %r; using %s", s, default)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Failed to parse number from: %r; using %s", s, default)
         return default
 
 
@@ -67,16 +89,28 @@ def to_dec_strict(s: str | float | int | Decimal | None) -> Decimal:
         return s
     if isinstance(s, (int, float)):
         return Decimal(str(s))
+    return _str_to_dec_strict(s)
+
+
+@functools.lru_cache(maxsize=4096)
+def _str_to_dec_strict(s: str) -> Decimal:
+    """String path of to_dec_strict, memoized on the raw cell text.
+
+    Quantities, prices and fees repeat heavily across statement rows; Decimal is
+    immutable, so cached results can be shared.  Failures raise and are not cached.
+    """
+    if _PLAIN_NUM_RE.fullmatch(s):
+        return Decimal(s)
 
     s_stripped = s.strip()
     if not s_stripped:
         raise ValueError("Value is empty string")
 
-    if s_stripped in {"-", "--", "...", "N/A", "n/a"}:
+    if s_stripped in _SILENT_PLACEHOLDERS or s_stripped in _ELIDED_PLACEHOLDERS:
         raise ValueError(f"Value is a placeholder: {s_stripped!r}")
 
     try:
-        s_clean = NUM_CLEAN_RE.sub("", s_stripped)
+        s_clean = s_stripped.translate(_NUM_CLEAN_TABLE)
         return Decimal(s_clean)
     except InvalidOperation as e:
         raise ValueError(f"Invalid decimal format: {s!r}") from e
@@ -85,9 +119,19 @@ def to_dec_strict(s: str | float | int | Decimal | None) -> Decimal:
 def parse_date(d: str) -> dt.date:
     """Parse date-like strings.
     Handles 'YYYY-MM-DD' or 'YYYY-MM-DD, HH:MM:SS' or 'YYYY-MM-DD, HH:MM' etc.
+
+    Memoized on the date part: trade timestamps are nearly unique per row, but the
+    few hundred distinct days they fall on repeat across thousands of rows, and
+    dt.date results are immutable.
     """
-    if "," in d:
-        d = d.split(",")[0].strip()
+    i = d.find(",")
+    if i >= 0:
+        d = d[:i].strip()
+    return _parse_iso_date(d)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_date(d: str) -> dt.date:
     return dt.date.fromisoformat(d)
 
 
@@ -96,6 +140,7 @@ def date_key(d: str | dt.date) -> str:
     if isinstance(d, dt.date):
         return d.isoformat()
     # If it's 'YYYY-MM-DD, 09:30:00', strip time
-    if "," in d:
-        d = d.split(",")[0].strip()
+    i = d.find(",")
+    if i >= 0:
+        d = d[:i].strip()
     return d
@@ -1,5 +1,14 @@
 import logging
 
+# Fixed three-letter tags for the standard level names
+_SHORTMAP = {
+    "DEBUG": "DBG",
+    "INFO": "INF",
+    "WARNING": "WRN",
+    "ERROR": "ERR",
+    "CRITICAL": "CRT",
+}
+
 
 class ProfessionalFormatter(logging.Formatter):
     def __init__(self) -> None:
@@ -8,16 +17,8 @@ class ProfessionalFormatter(logging.Formatter):
             datefmt="%Y-%m-%d %H:%M:%S",
         )
 
-        self.shortmap = {
-            "DEBUG": "DBG",
-            "INFO": "INF",
-            "WARNING": "WRN",
-            "ERROR": "ERR",
-            "CRITICAL": "CRT",
-        }
-
     def format(self, record: logging.LogRecord) -> str:
-        record.shortlevel = self.shortmap.get(record.levelname, "???")
+        record.shortlevel = _SHORTMAP.get(record.levelname, "???")
         return super().format(record)
 
 
@@ -37,7 +38,11 @@ class ShortLevelFormatter(logging.Formatter):
 
 
 def configure_logging(level: int = logging.WARNING) -> logging.Logger:
-    """Set up logging configuration with short level names and return a logger."""
+    """Set up logging configuration with short level names and return a logger.
+
+    Safe to call repeatedly: the handler is only attached when the root logger has
+    none, so records are never formatted more than once.
+    """
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
     if not root_logger.handlers:
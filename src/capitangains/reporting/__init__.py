@@ -1,4 +1,7 @@
+from typing import TYPE_CHECKING, Any
+
 from .extract import (
+    EXTRACTED_SECTIONS,
     TradeRow,
     TransferRow,
     parse_dividends,
@@ -10,11 +13,14 @@ from .extract import (
 )
 from .fifo import FifoMatcher, Lot, RealizedLine
 from .fx import FxTable
-from .reconcile import reconcile_with_ibkr_summary
+from .reconcile import PERFORMANCE_SUMMARY_SECTION, reconcile_with_ibkr_summary
 from .report_builder import ReportBuilder
-from .report_sink import ExcelReportSink, OdsReportSink, ReportSink
+
+if TYPE_CHECKING:
+    from .report_sink import ExcelReportSink, OdsReportSink, ReportSink
 
 __all__ = [
+    "EXTRACTED_SECTIONS",
     "TradeRow",
     "TransferRow",
     "parse_trades_stocklike",
@@ -27,9 +33,22 @@ __all__ = [
     "RealizedLine",
     "Lot",
     "FxTable",
+    "PERFORMANCE_SUMMARY_SECTION",
     "reconcile_with_ibkr_summary",
     "ReportBuilder",
     "ReportSink",
     "ExcelReportSink",
     "OdsReportSink",
 ]
+
+
+# Report sinks pull in openpyxl; import them on first access only.
+_LAZY_SINKS = frozenset({"ReportSink", "ExcelReportSink", "OdsReportSink"})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SINKS:
+        from . import report_sink
+
+        return getattr(report_sink, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,32 +1,72 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
 import logging
 import re
+import sys
 from collections import Counter
+from collections.abc import Sequence
 from dataclasses import dataclass
 from decimal import Decimal
+from operator import attrgetter
 
 from capitangains.conv import parse_date, to_dec, to_dec_strict
 from capitangains.model import IbkrModel
 
 logger = logging.getLogger(__name__)
 
-_STOCKS = {"Stocks", "Stock"}
-_ETFS = {"ETF", "ETFs", "ETCs", "ETP"}
-ALL_SCOPES_SET: dict[str, set[str] | None] = {
+# Statement sections read by the extractors below
+TRADES_SECTION = "Trades"
+DIVIDENDS_SECTION = "Dividends"
+WITHHOLDING_TAX_SECTION = "Withholding Tax"
+SYEP_INTEREST_SECTION = (
+    "Stock Yield Enhancement Program Securities Lent Interest Details"
+)
+INTEREST_SECTION = "Interest"
+TRANSFERS_SECTION = "Transfers"
+EXTRACTED_SECTIONS = frozenset(
+    {
+        TRADES_SECTION,
+        DIVIDENDS_SECTION,
+        WITHHOLDING_TAX_SECTION,
+        SYEP_INTEREST_SECTION,
+        INTEREST_SECTION,
+        TRANSFERS_SECTION,
+    }
+)
+
+_TRADE_SORT_KEY = attrgetter("date", "datetime_str")
+_ZERO = Decimal("0")
+# Withholding type by lowercase description substring, most specific first.
+# "dividend" catches "cash dividend", "payment in lieu of dividend", "interest
+# dividend", etc. and so takes precedence over generic "interest".  Substring
+# tests on the lowered text measured an order of magnitude faster than a single
+# case-insensitive alternation regex.
+_WHT_TYPE_RULES = (
+    ("credit interest", "Interest"),
+    ("dividend", "Dividend"),
+    ("interest", "Interest"),
+)
+# Country suffix of withholding descriptions, e.g. " - US Tax"
+_WHT_COUNTRY_RE = re.compile(r"-\s+([A-Z]{2})\s+Tax\b")
+
+_STOCKS = frozenset({"Stocks", "Stock"})
+_ETFS = frozenset({"ETF", "ETFs", "ETCs", "ETP"})
+ALL_SCOPES_SET: dict[str, frozenset[str] | None] = {
     "stocks": _STOCKS,
     "etfs": _ETFS,
     "stocks_etfs": _STOCKS | _ETFS,
     "all": None,
 }
 
-ASSET_STOCK_LIKE = {"Stocks", "Stock", "ETFs", "ETF", "ETCs", "ETP"}
+ASSET_STOCK_LIKE = frozenset({"Stocks", "Stock", "ETFs", "ETF", "ETCs", "ETP"})
 
 
 def _is_total_or_empty(value: str) -> bool:
     """Return True if value is empty or a 'Total' summary row."""
-    return not value or value.lower().startswith("total")
+    # Lowercase only the 5-char prefix rather than copying the whole cell
+    return not value or value[:5].lower() == "total"
 
 
 def _require_fields(label: str, **fields: str) -> None:
@@ -65,8 +105,13 @@ NEED_TRADE_COLS = [
     "Code",
 ]
 
+_TRADE_COL_SET = frozenset(TRADE_COLS)
 
-@dataclass
+
+# Slotted but deliberately not frozen: frozen dataclasses assign every field through
+# object.__setattr__, which made construction several times slower on the per-row
+# extraction path.
+@dataclass(slots=True)
 class TradeRow:
     section: str
     asset_category: str
@@ -83,7 +128,7 @@ class TradeRow:
     realized_pl_ccy: Decimal | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferRow:
     section: str
     asset_category: str
@@ -96,7 +141,7 @@ class TransferRow:
     code: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DividendRow:
     currency: str
     date: dt.date
@@ -105,7 +150,7 @@ class DividendRow:
     amount_eur: Decimal | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WithholdingRow:
     currency: str
     date: dt.date
@@ -117,7 +162,7 @@ class WithholdingRow:
     amount_eur: Decimal | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InterestRow:
     currency: str
     date: dt.date
@@ -126,7 +171,7 @@ class InterestRow:
     amount_eur: Decimal | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SyepInterestRow:
     currency: str
     value_date: dt.date | None
@@ -141,64 +186,98 @@ class SyepInterestRow:
     interest_paid_eur: Decimal | None = None
 
 
+def _optional_dec(s: str | None) -> Decimal | None:
+    """Parse an optional numeric cell, mapping absent/placeholder values to None.
+
+    Absent columns and empty cells are the common case for Basis and Realized P/L,
+    so they return early instead of raising through to_dec_strict.
+    """
+    if not s:
+        return None
+    try:
+        return to_dec_strict(s)
+    except ValueError:
+        return None
+
+
 def parse_trades_stocklike_row(
-    scope_set: set[str] | None, r: dict[str, str], col: dict[str, int | None]
+    scope_set: frozenset[str] | None,
+    r: dict[str, str],
+    col: dict[str, int | None],
+    comm_key: str | None = None,
 ) -> TradeRow | None:
-    asset_category = r.get("Asset Category", "").strip()
+    g = r.get
+    asset_category = g("Asset Category", "").strip()
     if scope_set is not None and asset_category not in scope_set:
         return None
 
-    currency = r.get("Currency", "").strip()
-    symbol = r.get("Symbol", "").strip()
+    # Symbol and currency key the position book and the per-symbol totals; interning
+    # lets every row for the same instrument share one string object.
+    currency = sys.intern(g("Currency", "").strip())
+    symbol = sys.intern(g("Symbol", "").strip())
     _require_fields("trade row", symbol=symbol, currency=currency)
-    dt_str = r.get("Date/Time", "").strip()
-    qty_s = r.get("Quantity", "").strip()
-    proceeds_s = r.get("Proceeds", "").strip()
-    code = r.get("Code", "").strip()
+    dt_str = g("Date/Time", "").strip()
+    qty_s = g("Quantity", "").strip()
+    proceeds_s = g("Proceeds", "").strip()
+    code = sys.intern(g("Code", "").strip())
+
+    # Only track non-zero quantity; rejected rows skip the remaining conversions
+    quantity = to_dec_strict(qty_s)
+    if quantity == 0:
+        return None
 
-    t_price_s = r.get("T. Price", "").strip()
+    t_price_s = g("T. Price", "").strip()
 
     # Commission column can be 'Comm/Fee' in stock trades; 'Comm in EUR' appears in some
-    # Forex tables.
-    comm_s = ""
-    if "Comm/Fee" in r:
-        comm_s = r.get("Comm/Fee", "").strip()
-    elif "Comm in EUR" in r:
-        # Some subtables only have Comm in EUR (e.g., Forex); we don't use them here,
-        # but keep consistent type.
-        comm_s = r.get("Comm in EUR", "").strip()
+    # Forex tables. Some subtables only have Comm in EUR (e.g., Forex); we don't use
+    # them here, but keep consistent type. A present-but-empty 'Comm/Fee' still wins.
+    # parse_trades_stocklike resolves the column once per subtable via comm_key.
+    if comm_key is None:
+        comm_key = "Comm/Fee" if "Comm/Fee" in r else "Comm in EUR"
+    comm_s = g(comm_key, "").strip()
 
     # Placeholders like "..." must map to None (missing), not Decimal("0"), because
     # downstream gap synthesis treats 0 as a real value and would falsely mark gaps
     # as fixed with zero cost.
-    try:
-        basis_opt: Decimal | None = to_dec_strict(r.get("Basis"))
-    except ValueError:
-        basis_opt = None
-
-    try:
-        realized_opt: Decimal | None = to_dec_strict(r.get("Realized P/L"))
-    except ValueError:
-        realized_opt = None
+    basis_opt = _optional_dec(g("Basis"))
+    realized_opt = _optional_dec(g("Realized P/L"))
 
-    trade = TradeRow(
-        section="Trades",
-        asset_category=asset_category,
+    return TradeRow(
+        section=TRADES_SECTION,
+        asset_category=sys.intern(asset_category),
         currency=currency,
         symbol=symbol,
         datetime_str=dt_str,
         date=parse_date(dt_str),
-        quantity=to_dec_strict(qty_s),
+        quantity=quantity,
         t_price=to_dec_strict(t_price_s),
         proceeds=to_dec_strict(proceeds_s),
-        comm_fee=to_dec(comm_s),
+        comm_fee=to_dec(comm_s) if comm_s else _ZERO,
         code=code,
         basis_ccy=basis_opt,
         realized_pl_ccy=realized_opt,
     )
 
-    # Only track non-zero quantity
-    return trade if trade.quantity != 0 else None
+
+def _trade_columns(
+    header: Sequence[str],
+) -> tuple[dict[str, int | None], list[str]]:
+    """Locate TRADE_COLS in a Trades header (be lenient about padding).
+
+    Returns the column map and the essential columns (NEED_TRADE_COLS) the header
+    lacks; the map is only built, and left non-empty, when none are missing.
+    First occurrence wins when a header repeats a column name.
+    """
+    # One pass over the header, recording only the names we look for
+    col: dict[str, int | None] = dict.fromkeys(TRADE_COLS)
+    for i, h in enumerate(header):
+        name = h.strip()
+        if name in _TRADE_COL_SET and col[name] is None:
+            col[name] = i
+    missing = [n for n in NEED_TRADE_COLS if col[n] is None]
+    if missing:
+        return {}, missing
+    return col, missing
 
 
 def parse_trades_stocklike(
@@ -208,10 +287,13 @@ def parse_trades_stocklike(
     asset_scope: 'stocks', 'etfs', 'stocks_etfs', 'all'
     """
     scope_set = ALL_SCOPES_SET[asset_scope]
-    trades: list[TradeRow] = []
+    # Buys and sells are collected apart so the sign is tested once per trade
+    buys: list[TradeRow] = []
+    sells: list[TradeRow] = []
+    buys_append = buys.append
+    sells_append = sells.append
 
-    for sub in model.get_subtables("Trades"):
-        header = [h.strip() for h in sub.header]
+    for sub in model.get_subtables(TRADES_SECTION):
         rows = sub.rows
 
         if logger.isEnabledFor(logging.DEBUG):
@@ -224,65 +306,70 @@ def parse_trades_stocklike(
                 asset_categories,
             )
 
-        # Try to locate relevant columns (be lenient)
-        col: dict[str, int | None] = {k: None for k in TRADE_COLS}
-        for name in col:
-            for i, h in enumerate(header):
-                if h == name:
-                    col[name] = i
-                    break
-
         # Skip subtables without essential columns
-        if any(col[n] is None for n in NEED_TRADE_COLS):
-            logger.debug("Skipping Trades subtable, missing cols: %s", col)
+        col, missing = _trade_columns(sub.header)
+        if missing:
+            logger.debug("Skipping Trades subtable, missing cols: %s", missing)
             continue
 
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "Mapped Trades columns: %s",
-                {k: header[v] for k, v in col.items() if v is not None},
+                {k: sub.header[v].strip() for k, v in col.items() if v is not None},
             )
 
+        # Rows are keyed by the raw header cells, so key presence is per subtable
+        comm_key = "Comm/Fee" if "Comm/Fee" in sub.header else "Comm in EUR"
         for r in rows:
-            trade = parse_trades_stocklike_row(scope_set, r, col)
-            if trade is not None:
-                trades.append(trade)
+            trade = parse_trades_stocklike_row(scope_set, r, col, comm_key)
+            if trade is None:
+                continue
+            if trade.quantity > 0:
+                buys_append(trade)
+            else:
+                sells_append(trade)
 
     # Sort by actual execution date/time for deterministic FIFO (buys before sells if
-    # same timestamp use quantity sign)
-    trades.sort(key=lambda tr: (tr.date, tr.datetime_str, tr.quantity <= 0))
+    # same timestamp use quantity sign). Zero-quantity rows were dropped above, so
+    # partitioning buys ahead of sells and then stable-sorting on a C-level key gives
+    # the same order as keying on (date, datetime_str, quantity <= 0).
+    trades = buys + sells
+    trades.sort(key=_TRADE_SORT_KEY)
     if logger.isEnabledFor(logging.DEBUG):
-        buys = sum(1 for t in trades if t.quantity > 0)
-        sells = sum(1 for t in trades if t.quantity < 0)
         logger.debug(
             "Extracted %d trades (%d buys, %d sells)",
             len(trades),
-            buys,
-            sells,
+            len(buys),
+            len(sells),
         )
 
     return trades
 
 
-def parse_dividends(model: IbkrModel) -> list[DividendRow]:
+def parse_dividends(model: IbkrModel, *, year: int | None = None) -> list[DividendRow]:
+    """Extract dividend rows; with `year`, rows dated in other years are skipped
+    before their amounts are parsed."""
     out: list[DividendRow] = []
-    for r in model.iter_rows("Dividends"):
+    out_append = out.append
+    for r in model.iter_rows(DIVIDENDS_SECTION):
         # Header: Currency,Date,Description,Amount
         cur = r.get("Currency", "").strip()
         date_s = r.get("Date", "").strip()
         desc = r.get("Description", "").strip()
-        amount_s = r.get("Amount", "").strip()
         # Rows lacking currency/date/description are typically totals or non-data lines;
         # structural anomalies are already reported by the CSV parser, so we silently
         # filter these here rather than logging again.
         if not (cur and date_s and desc):
             continue
+        date = parse_date(date_s)
+        if year is not None and date.year != year:
+            continue
 
-        amt = to_dec_strict(amount_s)
-        out.append(
+        amt = to_dec_strict(r.get("Amount", "").strip())
+        out_append(
             DividendRow(
-                currency=cur,
-                date=parse_date(date_s),
+                currency=sys.intern(cur),
+                date=date,
                 description=desc,
                 amount=amt,
             )
@@ -293,34 +380,65 @@ def parse_dividends(model: IbkrModel) -> list[DividendRow]:
     return out
 
 
-def parse_withholding_tax(model: IbkrModel) -> list[WithholdingRow]:
+@functools.lru_cache(maxsize=1024)
+def _classify_withholding(desc: str) -> tuple[str | None, str]:
+    """Return (type, country) for a withholding description.
+
+    The type comes from the first matching _WHT_TYPE_RULES entry (None when none
+    match); the country from a suffix like " - US Tax" ("" when absent).  Memoized
+    so each distinct description is lowered and scanned once rather than per row.
+    """
+    dlow = desc.lower()
+    wtype = None
+    for needle, rule_type in _WHT_TYPE_RULES:
+        if needle in dlow:
+            wtype = rule_type
+            break
+    country = ""
+    if "Tax" in desc:
+        # Canonical IBKR suffix " - XX Tax" is sliced directly; with a single "Tax"
+        # in the text the regex could only have matched that same suffix.
+        _head, sep, tail = desc.rpartition(" - ")
+        cc = tail[:2]
+        if (
+            sep
+            and len(tail) == 6
+            and tail.endswith(" Tax")
+            and cc.isascii()
+            and cc.isalpha()
+            and cc.isupper()
+            and desc.count("Tax") == 1
+        ):
+            country = cc
+        elif m := _WHT_COUNTRY_RE.search(desc):
+            country = m.group(1)
+    return wtype, country
+
+
+def parse_withholding_tax(
+    model: IbkrModel, *, year: int | None = None
+) -> list[WithholdingRow]:
+    """Extract withholding tax rows; with `year`, rows dated in other years are
+    skipped before their amounts are parsed and classified."""
     out: list[WithholdingRow] = []
-    for r in model.iter_rows("Withholding Tax"):
+    out_append = out.append
+    for r in model.iter_rows(WITHHOLDING_TAX_SECTION):
         cur = r.get("Currency", "").strip()
         date_s = r.get("Date", "").strip()
         desc = r.get("Description", "").strip()
-        amount_s = r.get("Amount", "").strip()
-        code = r.get("Code", "").strip() if "Code" in r else ""
 
         # As with dividends, missing currency/date/description indicates totals or
         # non-data rows; malformed structure is handled at CSV parse time.
         if not (cur and date_s and desc):
             continue
+        date = parse_date(date_s)
+        if year is not None and date.year != year:
+            continue
 
-        amt = to_dec_strict(amount_s)
-        dlow = desc.lower()
-        # Classify withholding tax type with explicit precedence
-        # Most specific patterns first, then generic fallbacks
-        if "credit interest" in dlow:
-            wtype = "Interest"
-        elif "dividend" in dlow:
-            # Catches "cash dividend", "payment in lieu of dividend", "interest
-            # dividend", etc.; dividend takes precedence
-            wtype = "Dividend"
-        elif "interest" in dlow:
-            # Generic interest (not dividend-related, already caught above)
-            wtype = "Interest"
-        else:
+        amt = to_dec_strict(r.get("Amount", "").strip())
+        code = r.get("Code", "").strip() if "Code" in r else ""
+        wtype, country = _classify_withholding(desc)
+        if wtype is None:
             # Unknown/other
             logger.warning(
                 "Unrecognized withholding tax description: %r. "
@@ -329,16 +447,10 @@ def parse_withholding_tax(model: IbkrModel) -> list[WithholdingRow]:
             )
             wtype = "Unknown"
 
-        # Extract country from suffix like " - US Tax" or " - NL Tax"
-        country = ""
-        m = re.search(r"-\s+([A-Z]{2})\s+Tax\b", desc)
-        if m:
-            country = m.group(1)
-
-        out.append(
+        out_append(
             WithholdingRow(
-                currency=cur,
-                date=parse_date(date_s),
+                currency=sys.intern(cur),
+                date=date,
                 description=desc,
                 amount=amt,
                 code=code,
@@ -358,32 +470,42 @@ def parse_withholding_tax(model: IbkrModel) -> list[WithholdingRow]:
     return out
 
 
-def parse_syep_interest_details(model: IbkrModel) -> list[SyepInterestRow]:
+def parse_syep_interest_details(
+    model: IbkrModel, *, year: int | None = None
+) -> list[SyepInterestRow]:
     """Parse 'Stock Yield Enhancement Program Securities Lent Interest Details'.
 
     Expected header:
       Currency, Value Date, Symbol, Start Date, Quantity, Collateral Amount,
       Market-based Rate (%), Interest Rate on Customer Collateral (%),
       Interest Paid to Customer, Code
+
+    With `year`, only rows whose value date falls in that year are kept; rows
+    without a value date are dropped.
     """
     out: list[SyepInterestRow] = []
-    section = "Stock Yield Enhancement Program Securities Lent Interest Details"
-    for r in model.iter_rows(section):
-        cur = r.get("Currency", "").strip()
-        value_date_s = r.get("Value Date", "").strip()
-        sym = r.get("Symbol", "").strip()
-        start_date_s = r.get("Start Date", "").strip()
-        qty_s = r.get("Quantity", "").strip()
-        collat_s = r.get("Collateral Amount", "").strip()
-        mkt_rate_s = r.get("Market-based Rate (%)", "").strip()
-        cust_rate_s = r.get("Interest Rate on Customer Collateral (%)", "").strip()
-        paid_s = r.get("Interest Paid to Customer", "").strip()
-        code = r.get("Code", "").strip()
-
+    out_append = out.append
+    for r in model.iter_rows(SYEP_INTEREST_SECTION):
+        g = r.get
+        cur = g("Currency", "").strip()
         # Skip trailing totals like 'Total', 'Total in EUR'.
         if _is_total_or_empty(cur):
             continue
 
+        value_date_s = g("Value Date", "").strip()
+        value_date = parse_date(value_date_s) if value_date_s else None
+        if year is not None and (value_date is None or value_date.year != year):
+            continue
+
+        sym = g("Symbol", "").strip()
+        start_date_s = g("Start Date", "").strip()
+        qty_s = g("Quantity", "").strip()
+        collat_s = g("Collateral Amount", "").strip()
+        mkt_rate_s = g("Market-based Rate (%)", "").strip()
+        cust_rate_s = g("Interest Rate on Customer Collateral (%)", "").strip()
+        paid_s = g("Interest Paid to Customer", "").strip()
+        code = g("Code", "").strip()
+
         if not (qty_s and collat_s and mkt_rate_s and cust_rate_s and paid_s):
             raise ValueError(f"Invalid SYEP interest row (missing numeric fields): {r}")
 
@@ -393,11 +515,11 @@ def parse_syep_interest_details(model: IbkrModel) -> list[SyepInterestRow]:
         customer_rate_pct = to_dec_strict(cust_rate_s)
         interest_paid = to_dec_strict(paid_s)
 
-        out.append(
+        out_append(
             SyepInterestRow(
-                currency=cur,
-                value_date=(parse_date(value_date_s) if value_date_s else None),
-                symbol=sym,
+                currency=sys.intern(cur),
+                value_date=value_date,
+                symbol=sys.intern(sym),
                 start_date=(parse_date(start_date_s) if start_date_s else None),
                 quantity=quantity,
                 collateral_amount=collateral_amount,
@@ -413,17 +535,19 @@ def parse_syep_interest_details(model: IbkrModel) -> list[SyepInterestRow]:
     return out
 
 
-def parse_interest(model: IbkrModel) -> list[InterestRow]:
+def parse_interest(model: IbkrModel, *, year: int | None = None) -> list[InterestRow]:
     """Parse 'Interest' section: credit/debit interest and monthly SYEP interest
     summaries.
 
     Header: Currency, Date, Description, Amount
 
-    Excludes CSV total rows (e.g., 'Total', 'Total in EUR').
+    Excludes CSV total rows (e.g., 'Total', 'Total in EUR').  With `year`, rows
+    dated in other years are skipped before their amounts are parsed.
 
     """
     out: list[InterestRow] = []
-    for r in model.iter_rows("Interest"):
+    out_append = out.append
+    for r in model.iter_rows(INTEREST_SECTION):
         cur = r.get("Currency", "").strip()
         if _is_total_or_empty(cur):
             continue
@@ -439,11 +563,14 @@ def parse_interest(model: IbkrModel) -> list[InterestRow]:
         # If we ever decide that a partial row here is an invariant violation, the
         # correct response would be to raise, not to emit a quiet debug log.
         if cur and date_s and desc:
+            date = parse_date(date_s)
+            if year is not None and date.year != year:
+                continue
             amt = to_dec_strict(amount_s)
-            out.append(
+            out_append(
                 InterestRow(
-                    currency=cur,
-                    date=parse_date(date_s),
+                    currency=sys.intern(cur),
+                    date=date,
                     description=desc,
                     amount=amt,
                 )
@@ -469,22 +596,27 @@ def parse_transfers(model: IbkrModel) -> list[TransferRow]:
       as a proxy for cost basis, which may differ from IBKR's internal basis.
     """
     out: list[TransferRow] = []
+    out_append = out.append
 
-    for sub in model.get_subtables("Transfers"):
+    for sub in model.get_subtables(TRANSFERS_SECTION):
         rows = sub.rows
+        # Fallback columns exist per subtable (rows are keyed by its header)
+        has_quantity = "Quantity" in sub.header
+        has_cost_basis = "Cost Basis" in sub.header
 
         # We only care about stock-like transfers
         for r in rows:
-            asset_cat = r.get("Asset Category", "").strip()
+            g = r.get
+            asset_cat = g("Asset Category", "").strip()
             if asset_cat not in ASSET_STOCK_LIKE:
                 continue
 
-            symbol = r.get("Symbol", "").strip()
-            date_s = r.get("Date", "").strip()
-            direction = r.get("Direction", "").strip()  # "In" or "Out"
-            qty_s = r.get("Qty", "").strip()
-            if not qty_s and "Quantity" in r:
-                qty_s = r.get("Quantity", "").strip()
+            symbol = g("Symbol", "").strip()
+            date_s = g("Date", "").strip()
+            direction = g("Direction", "").strip()  # "In" or "Out"
+            qty_s = g("Qty", "").strip()
+            if not qty_s and has_quantity:
+                qty_s = g("Quantity", "").strip()
 
             # For incoming transfers, we need the initial cost basis.
             # Usually "Market Value" at transfer time is used if no other basis is
@@ -498,12 +630,12 @@ def parse_transfers(model: IbkrModel) -> list[TransferRow]:
             # Or perhaps there is a "Cost Basis" column in other variants.
 
             # Let's try to find a value field
-            val_s = r.get("Market Value", "").strip()
-            if not val_s and "Cost Basis" in r:
-                val_s = r.get("Cost Basis", "").strip()
+            val_s = g("Market Value", "").strip()
+            if not val_s and has_cost_basis:
+                val_s = g("Cost Basis", "").strip()
 
-            code = r.get("Code", "").strip()
-            currency = r.get("Currency", "").strip()
+            code = g("Code", "").strip()
+            currency = g("Currency", "").strip()
 
             _require_fields(
                 "transfer row",
@@ -541,22 +673,22 @@ def parse_transfers(model: IbkrModel) -> list[TransferRow]:
                 # matching.
                 market_value = to_dec(val_s)
 
-            out.append(
+            out_append(
                 TransferRow(
-                    section="Transfers",
-                    asset_category=asset_cat,
-                    currency=currency,
-                    symbol=symbol,
+                    section=TRANSFERS_SECTION,
+                    asset_category=sys.intern(asset_cat),
+                    currency=sys.intern(currency),
+                    symbol=sys.intern(symbol),
                     date=parse_date(date_s),
-                    direction=direction,
+                    direction=sys.intern(direction),
                     quantity=quantity,
                     market_value=market_value,
                     code=code,
                 )
             )
 
-    # Sort by date
-    out.sort(key=lambda x: x.date)
+    # Sort by date (stable; attrgetter keeps the key extraction in C)
+    out.sort(key=attrgetter("date"))
 
     if logger.isEnabledFor(logging.DEBUG):
         ins = sum(1 for t in out if t.direction.lower() == "in")
@@ -165,40 +165,44 @@ class FifoMatcher:
             trade.currency,
         )
         self.positions.append_buy(trade.symbol, lot)
-        logger.debug(
-            "Position book for %s/%s: %d lots, total qty: %s",
-            trade.symbol,
-            trade.currency,
-            self.positions.lot_count(trade.symbol, trade.currency),
-            self.positions.total_qty(trade.symbol, trade.currency),
-        )
+        # total_qty() walks every open lot, so only pay for it when it is logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Position book for %s/%s: %d lots, total qty: %s",
+                trade.symbol,
+                trade.currency,
+                self.positions.lot_count(trade.symbol, trade.currency),
+                self.positions.total_qty(trade.symbol, trade.currency),
+            )
         return None
 
     def _ingest_sell(self, trade: TradeProtocol) -> RealizedLine:
         if trade.quantity >= 0:
             raise ValueError("sell trades must have negative quantity")
         qty_to_sell = abs_decimal(trade.quantity)
+        debug = logger.isEnabledFor(logging.DEBUG)
 
-        logger.debug(
-            "Processing SELL: %s %s @ %s (available lots: %d)",
-            qty_to_sell,
-            trade.symbol,
-            trade.date,
-            self.positions.lot_count(trade.symbol, trade.currency),
-        )
+        if debug:
+            logger.debug(
+                "Processing SELL: %s %s @ %s (available lots: %d)",
+                qty_to_sell,
+                trade.symbol,
+                trade.date,
+                self.positions.lot_count(trade.symbol, trade.currency),
+            )
 
         legs, alloc_cost_ccy, qty_remaining = self.positions.consume_fifo(
             trade.symbol, trade.currency, qty_to_sell
         )
 
-        matched_qty = qty_to_sell - qty_remaining
-        logger.debug(
-            "FIFO consumed %d leg(s) for %s shares, cost: %s %s",
-            len(legs),
-            matched_qty,
-            alloc_cost_ccy,
-            trade.currency,
-        )
+        if debug:
+            logger.debug(
+                "FIFO consumed %d leg(s) for %s shares, cost: %s %s",
+                len(legs),
+                qty_to_sell - qty_remaining,
+                alloc_cost_ccy,
+                trade.currency,
+            )
 
         gap_event: GapEvent | None = None
         has_gap = qty_remaining > 0
@@ -209,7 +213,7 @@ class FifoMatcher:
                 "Gap detected: %s shares unmatched (needed: %s, matched: %s)",
                 qty_remaining,
                 qty_to_sell,
-                matched_qty,
+                qty_to_sell - qty_remaining,
             )
             logger.debug("Invoking gap policy: %s", type(self._gap_policy).__name__)
             legs, alloc_cost_ccy, gap_event = self._gap_policy.resolve(
@@ -237,7 +241,7 @@ class FifoMatcher:
         if gap_event is not None:
             self.recorder.record_gap(gap_event)
 
-        line = build_realized_line(trade, legs, alloc_cost_ccy)
+        line = build_realized_line(trade, legs, alloc_cost_ccy, qty_to_sell)
         if has_gap:
             line.has_gap = True
             line.gap_fixed = gap_fixed
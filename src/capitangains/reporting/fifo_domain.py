@@ -47,7 +47,7 @@ class TransferProtocol(Protocol):
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class SellMatchLeg:
     buy_date: dt.date | None
     qty: Decimal
@@ -59,7 +59,7 @@ class SellMatchLeg:
     proceeds_share_eur: Decimal | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Lot:
     buy_date: dt.date
     qty: Decimal  # remaining quantity in lot
@@ -68,7 +68,7 @@ class Lot:
     transferred: bool = False  # True if lot originated from a transfer
 
 
-@dataclass
+@dataclass(slots=True)
 class RealizedLine:
     symbol: str
     currency: str
@@ -79,6 +79,7 @@ class RealizedLine:
     sell_net_ccy: Decimal  # gross + comm (fees reduce proceeds)
     legs: list[SellMatchLeg]
     realized_pl_ccy: Decimal
+    alloc_cost_ccy: Decimal  # sum of the legs' alloc_cost_ccy
     has_gap: bool = False
     gap_fixed: bool = False
     sell_gross_eur: Decimal | None = None
@@ -88,7 +89,7 @@ class RealizedLine:
     realized_pl_eur: Decimal | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GapEvent:
     symbol: str
     date: dt.date
@@ -3,17 +3,18 @@ from __future__ import annotations
 import bisect
 import csv
 import datetime as dt
+import functools
 import logging
-from collections import defaultdict
 from decimal import Decimal, DivisionByZero
 from pathlib import Path
 
-from capitangains.conv import date_key, to_dec_strict
+from capitangains.conv import parse_date, to_dec_strict
 
 logger = logging.getLogger(__name__)
 
 # Maximum number of days to look back for FX rate before warning
 _MAX_FX_LOOKBACK_DAYS = 7
+_ONE = Decimal("1")
 
 
 class FxTable:
@@ -24,16 +25,35 @@ class FxTable:
     """
 
     def __init__(self) -> None:
-        # Map: currency -> { date -> Decimal(eur_per_unit) }, plus sorted date list
-        self.data: dict[str, dict[str, Decimal]] = defaultdict(dict)
-        self.date_index: dict[str, list[str]] = {}
+        # Per currency: ascending date ordinals with a parallel list of
+        # Decimal(eur_per_unit). Ordinals bisect as plain int comparisons.
+        self._ordinals: dict[str, list[int]] = {}
+        self._rates: dict[str, list[Decimal]] = {}
+        # Resolved lookups keyed by the caller's (date, currency); cleared on add_rate
+        self._lookups: dict[tuple[dt.date, str], Decimal | None] = {}
 
     @classmethod
     def from_csv(cls, path: str | Path) -> FxTable:
+        """Load an FX table from CSV.
+
+        Parsed rates are cached per (resolved path, mtime, size), so reloading an
+        unchanged file skips parsing.  Each call still returns a fresh table.
+        """
+        resolved = Path(path).resolve()
+        st = resolved.stat()
+        inst = cls()
+        for ccy, ords, rates in _load_csv_cached(resolved, st.st_mtime_ns, st.st_size):
+            inst._ordinals[ccy] = list(ords)
+            inst._rates[ccy] = list(rates)
+        return inst
+
+    @classmethod
+    def _from_csv_uncached(cls, path: str | Path) -> FxTable:
         inst = cls()
         with open(path, encoding="utf-8", newline="") as fp:
-            reader = csv.DictReader(fp)
-            fields = set(reader.fieldnames or [])
+            reader = csv.reader(fp)
+            header = next(reader, [])
+            fields = set(header)
             if not {"date", "currency"}.issubset(fields):
                 missing = {"date", "currency"} - fields
                 raise ValueError(f"FX table missing columns: {sorted(missing)}")
@@ -41,80 +61,119 @@ class FxTable:
             if "rate" not in fields:
                 raise ValueError("FX table must contain 'rate' (units per EUR) column")
 
+            # Positional access avoids building a dict per row; a repeated column
+            # name resolves to its last occurrence, as with csv.DictReader.
+            idx = {name: i for i, name in enumerate(header)}
+            i_date, i_ccy, i_rate = idx["date"], idx["currency"], idx["rate"]
+            width = max(i_date, i_ccy, i_rate) + 1
+
             for row in reader:
-                d = date_key(row["date"])
-                ccy = row["currency"].strip().upper()
+                if not row:
+                    # csv.DictReader skipped blank lines; keep doing so
+                    continue
+                if len(row) < width:
+                    raise ValueError(f"FX row has too few columns: {row!r}")
+                try:
+                    d = parse_date(row[i_date].strip())
+                except ValueError:
+                    # The dict-based table kept unparseable dates as keys that no
+                    # lookup could ever hit; skip them the same way, but say so.
+                    logger.warning("Skipping FX row with invalid date: %r", row)
+                    continue
+                ccy = row[i_ccy].strip().upper()
                 if not ccy:
                     raise ValueError(f"FX row missing currency for date {d}")
                 if ccy == "EUR":
                     # Store identity explicitly for completeness
-                    inst.data[ccy][d] = Decimal("1")
+                    inst.add_rate(d, ccy, _ONE)
                     continue
 
-                units_per_eur = to_dec_strict(row["rate"])  # e.g., 1 EUR = 1.91 AUD
+                units_per_eur = to_dec_strict(row[i_rate])  # e.g., 1 EUR = 1.91 AUD
                 if units_per_eur <= 0:
                     raise ValueError(
                         f"Encountered non-positive FX rate {units_per_eur} for {ccy} "
                         f"on {d}"
                     )
                 try:
-                    eur_per_unit = Decimal("1") / units_per_eur
+                    eur_per_unit = _ONE / units_per_eur
                 except DivisionByZero as exc:  # defensive, though checked above
                     raise ValueError(f"Invalid zero FX rate for {ccy} on {d}") from exc
 
-                inst.data[ccy][d] = eur_per_unit
-
-        for ccy, m in inst.data.items():
-            inst.date_index[ccy] = sorted(m.keys())
+                inst.add_rate(d, ccy, eur_per_unit)
 
         if logger.isEnabledFor(logging.DEBUG):
-            all_currencies = set(inst.data.keys())
             logger.debug(
                 "Loaded FX rates for %d currencies across %d dates",
-                len(all_currencies),
-                max(len(dates) for dates in inst.date_index.values())
-                if inst.date_index
-                else 0,
+                len(inst._ordinals),
+                max((len(ords) for ords in inst._ordinals.values()), default=0),
             )
-            for ccy in sorted(all_currencies):
-                rate_count = len(inst.data[ccy])
-                logger.debug("  %s: %d dates", ccy, rate_count)
+            for ccy in sorted(inst._ordinals):
+                logger.debug("  %s: %d dates", ccy, len(inst._ordinals[ccy]))
 
         return inst
 
+    def add_rate(self, date: dt.date, currency: str, eur_per_unit: Decimal) -> None:
+        """Record the EUR-per-unit rate for a currency on a date.
+
+        Rates usually arrive in ascending date order, so the insertion point is
+        almost always the tail.  A repeated date replaces the earlier rate.
+        """
+        self._lookups.clear()
+        c = currency.upper()
+        ords = self._ordinals.setdefault(c, [])
+        rates = self._rates.setdefault(c, [])
+        o = date.toordinal()
+        pos = bisect.bisect_left(ords, o)
+        if pos < len(ords) and ords[pos] == o:
+            rates[pos] = eur_per_unit
+        else:
+            ords.insert(pos, o)
+            rates.insert(pos, eur_per_unit)
+
     def has_rate_exact(self, date: dt.date, currency: str) -> bool:
         c = currency.upper()
         if c == "EUR":
             return True
-        d = date.isoformat()
-        return c in self.data and d in self.data[c]
+        ords = self._ordinals.get(c)
+        if not ords:
+            return False
+        o = date.toordinal()
+        pos = bisect.bisect_left(ords, o)
+        return pos < len(ords) and ords[pos] == o
 
     def get_rate(self, date: dt.date, currency: str) -> Decimal | None:
         """Return EUR per 1 unit of currency.
 
         If the exact date isn't available, falls back to the nearest previous
         available date for that currency (to accommodate weekends/holidays).
+
+        Results are memoized per (date, currency), so the stale-rate warning is
+        emitted once per distinct lookup rather than once per call.
         """
+        key = (date, currency)
+        try:
+            return self._lookups[key]
+        except KeyError:
+            pass
+        rate = self._resolve_rate(date, currency)
+        self._lookups[key] = rate
+        return rate
+
+    def _resolve_rate(self, date: dt.date, currency: str) -> Decimal | None:
         c = currency.upper()
         if c == "EUR":
-            return Decimal("1")
-        if c not in self.data:
+            return _ONE
+        ords = self._ordinals.get(c)
+        if ords is None:
             logger.debug(
                 "FX rate lookup: %s on %s: NOT FOUND (currency not in table)", c, date
             )
             return None
 
-        d = date.isoformat()
-        if d in self.data[c]:
-            rate = self.data[c][d]
-            logger.debug("FX rate lookup: %s on %s = %s (exact match)", c, date, rate)
-            return rate
-
-        # fallback to nearest previous date (weekends/holidays)
-        # Find the latest date <= d in sorted list
-        dates = self.date_index[c]
-
-        pos = bisect.bisect_right(dates, d)
+        # Latest date <= requested date; covers both exact hits and the fallback to
+        # the nearest previous date (weekends/holidays).
+        o = date.toordinal()
+        pos = bisect.bisect_right(ords, o)
         if pos == 0:
             logger.debug(
                 "FX rate lookup: %s on %s: NOT FOUND (no earlier date available)",
@@ -123,37 +182,45 @@ class FxTable:
             )
             return None
 
-        fallback_date_str = dates[pos - 1]
-        rate = self.data[c][fallback_date_str]
-        # Best-effort logging of fallback distance; do not crash on malformed keys.
-        try:
-            fallback_date = dt.date.fromisoformat(fallback_date_str)
-            days_back = (date - fallback_date).days
-            if days_back > _MAX_FX_LOOKBACK_DAYS:
-                logger.warning(
-                    "FX rate for %s on %s using %d-day-old rate from %s. "
-                    "Consider providing more recent FX data.",
-                    c,
-                    date,
-                    days_back,
-                    fallback_date,
-                )
-            else:
-                logger.debug(
-                    "FX rate lookup: %s on %s: fallback to %s (%d days earlier) = %s",
-                    c,
-                    date,
-                    fallback_date,
-                    days_back,
-                    rate,
-                )
-        except ValueError:
+        days_back = o - ords[pos - 1]
+        rate = self._rates[c][pos - 1]
+        if days_back == 0:
+            logger.debug("FX rate lookup: %s on %s = %s (exact match)", c, date, rate)
+            return rate
+
+        found_date = dt.date.fromordinal(ords[pos - 1])
+        if days_back > _MAX_FX_LOOKBACK_DAYS:
+            logger.warning(
+                "FX rate for %s on %s using %d-day-old rate from %s. "
+                "Consider providing more recent FX data.",
+                c,
+                date,
+                days_back,
+                found_date,
+            )
+        else:
             logger.debug(
-                "FX rate lookup: %s on %s: fallback to %r (unparseable date key) = %s",
+                "FX rate lookup: %s on %s: fallback to %s (%d days earlier) = %s",
                 c,
                 date,
-                fallback_date_str,
+                found_date,
+                days_back,
                 rate,
             )
 
         return rate
+
+
+_FxSnapshot = tuple[tuple[str, tuple[int, ...], tuple[Decimal, ...]], ...]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_csv_cached(path: Path, mtime_ns: int, size: int) -> _FxSnapshot:
+    # mtime_ns and size are part of the cache key only: they invalidate the entry
+    # when the file changes on disk.  The cached value is immutable so that
+    # add_rate() on one loaded table cannot leak into another.
+    table = FxTable._from_csv_uncached(path)
+    return tuple(
+        (ccy, tuple(ords), tuple(table._rates[ccy]))
+        for ccy, ords in table._ordinals.items()
+    )
@@ -6,11 +6,12 @@ MoneyLike = str | Decimal
 
 _MONEY_Q = Decimal("0.01")
 _ALLOCATION_Q = Decimal("0.00000001")
+_ZERO = Decimal("0")
 
 
 def quantize_money(value: Decimal, places: MoneyLike = _MONEY_Q) -> Decimal:
     """Quantize monetary values consistently across the codebase."""
-    quant = Decimal(places)
+    quant = places if isinstance(places, Decimal) else Decimal(places)
     return value.quantize(quant)
 
 
@@ -22,7 +23,10 @@ def quantize_allocation(value: Decimal) -> Decimal:
 def round_cost_piece(total_basis: Decimal, take: Decimal, lot_qty: Decimal) -> Decimal:
     """Allocate a proportional amount of basis with deterministic rounding."""
     if lot_qty == 0:
-        return Decimal("0")
+        return _ZERO
+    if take == lot_qty:
+        # Whole lot consumed: the ratio is exactly 1, so skip the divide/multiply
+        return quantize_allocation(total_basis)
     ratio = take / lot_qty
     alloc = total_basis * ratio
     return quantize_allocation(alloc)
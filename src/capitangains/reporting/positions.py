@@ -4,11 +4,21 @@ from collections import defaultdict, deque
 from decimal import Decimal
 
 from .fifo_domain import Lot, SellMatchLeg
-from .money import abs_decimal, quantize_allocation, round_cost_piece
+from .money import quantize_allocation, round_cost_piece
+
+# Negative basis left over by allocation rounding that is small enough to zero out
+_BASIS_DUST = quantize_allocation(Decimal("0.00000001"))
+_ZERO_BASIS = quantize_allocation(Decimal("0"))
+_ZERO = Decimal("0")
 
 
 class PositionBook:
-    """Maintain FIFO lots per symbol without matching policy concerns."""
+    """Maintain FIFO lots per symbol without matching policy concerns.
+
+    Lots live in a deque per (symbol, currency): buys append, fully consumed lots
+    leave with popleft(), both O(1) without the head-index bookkeeping or periodic
+    compaction a list would need.
+    """
 
     def __init__(self) -> None:
         self._positions: dict[tuple[str, str], deque[Lot]] = defaultdict(deque)
@@ -25,38 +35,40 @@ class PositionBook:
             raise ValueError("qty to consume must be positive")
 
         legs: list[SellMatchLeg] = []
-        alloc_cost_ccy = Decimal("0")
+        alloc_cost_ccy = _ZERO
         qty_remaining = qty
 
         lots = self._positions.get((symbol, currency))
         if not lots:
-            return [], Decimal("0"), qty
+            return [], _ZERO, qty
+        append_leg = legs.append
         while qty_remaining > 0 and lots:
             lot = lots[0]
-            take = min(qty_remaining, lot.qty)
-            cost_piece = round_cost_piece(lot.basis_ccy, take, lot.qty)
-            leg = SellMatchLeg(
-                buy_date=lot.buy_date,
-                qty=take,
-                lot_qty_before=lot.qty,
-                alloc_cost_ccy=cost_piece,
-                transferred=lot.transferred,
+            lot_qty = lot.qty
+            take = min(qty_remaining, lot_qty)
+            cost_piece = round_cost_piece(lot.basis_ccy, take, lot_qty)
+            append_leg(
+                SellMatchLeg(
+                    buy_date=lot.buy_date,
+                    qty=take,
+                    lot_qty_before=lot_qty,
+                    alloc_cost_ccy=cost_piece,
+                    transferred=lot.transferred,
+                )
             )
-            legs.append(leg)
             alloc_cost_ccy += cost_piece
 
-            lot.qty -= take
+            lot_qty -= take
+            lot.qty = lot_qty
             remaining_basis = lot.basis_ccy - cost_piece
-            if remaining_basis < 0 and abs_decimal(
-                remaining_basis
-            ) <= quantize_allocation(Decimal("0.00000001")):
-                lot.basis_ccy = quantize_allocation(Decimal("0"))
+            if -_BASIS_DUST <= remaining_basis < 0:
+                lot.basis_ccy = _ZERO_BASIS
             else:
                 lot.basis_ccy = remaining_basis
             qty_remaining -= take
 
-            if lot.qty <= 0:
-                if lot.qty < 0:
+            if lot_qty <= 0:
+                if lot_qty < 0:
                     raise ValueError("lot quantity cannot become negative")
                 lots.popleft()
 
@@ -69,9 +81,8 @@ class PositionBook:
     def total_qty(self, symbol: str, currency: str) -> Decimal:
         lots = self._positions.get((symbol, currency))
         if not lots:
-            return Decimal("0")
-        return sum((lot.qty for lot in lots), Decimal("0"))
+            return _ZERO
+        return sum((lot.qty for lot in lots), _ZERO)
 
     def has_position(self, symbol: str, currency: str) -> bool:
-        key = (symbol, currency)
-        return key in self._positions and bool(self._positions[key])
+        return bool(self._positions.get((symbol, currency)))
@@ -11,11 +11,18 @@ def build_realized_line(
     trade: TradeProtocol,
     legs: list[SellMatchLeg],
     alloc_cost_ccy: Decimal,
+    sell_qty: Decimal | None = None,
 ) -> RealizedLine:
+    """Assemble the realized line for a matched sell.
+
+    `sell_qty` lets the matcher pass the absolute quantity it already computed;
+    when omitted it is derived from the trade.
+    """
     sell_gross = sell_gross_ccy(trade.proceeds)
     sell_net = sell_net_ccy(trade.proceeds, trade.comm_fee)
     realized_ccy = quantize_money(sell_net - alloc_cost_ccy)
-    sell_qty = abs_decimal(trade.quantity)
+    if sell_qty is None:
+        sell_qty = abs_decimal(trade.quantity)
 
     return RealizedLine(
         symbol=trade.symbol,
@@ -27,4 +34,5 @@ def build_realized_line(
         sell_net_ccy=sell_net,
         legs=list(legs),
         realized_pl_ccy=realized_ccy,
+        alloc_cost_ccy=alloc_cost_ccy,
     )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Collection
 from decimal import Decimal
 
 from capitangains.conv import to_dec_strict
@@ -11,15 +12,25 @@ from .extract import ASSET_STOCK_LIKE
 
 logger = logging.getLogger(__name__)
 
+PERFORMANCE_SUMMARY_SECTION = "Realized & Unrealized Performance Summary"
 
-def reconcile_with_ibkr_summary(model: IbkrModel) -> dict[str, Decimal]:
+# Header names that look like P/L amount columns
+_PL_COLUMN_RE = re.compile(r"(?:Total|Realized|P/L|Profit|Loss)", re.IGNORECASE)
+_ZERO = Decimal("0")
+
+
+def reconcile_with_ibkr_summary(
+    model: IbkrModel, symbols: Collection[str] | None = None
+) -> dict[str, Decimal]:
     """Try to read 'Realized & Unrealized Performance Summary' for Stocks.
 
     Returns map: symbol -> realized_eur.
     If parsing fails (sanitized CSV), returns empty dict.
+    When `symbols` is given, rows for any other symbol are skipped before their
+    numeric columns are parsed.
     """
     result: dict[str, Decimal] = {}
-    for sub in model.get_subtables("Realized & Unrealized Performance Summary"):
+    for sub in model.get_subtables(PERFORMANCE_SUMMARY_SECTION):
         header = [h.strip() for h in sub.header]
         rows = sub.rows
 
@@ -48,11 +59,7 @@ def reconcile_with_ibkr_summary(model: IbkrModel) -> dict[str, Decimal]:
 
         # Try to find a realized EUR column. Heuristic: pick the last numeric column.
         # Because in some sanitized exports values are elided with "...", we may fail.
-        numeric_cols = [
-            i
-            for i, h in enumerate(header)
-            if re.search(r"(Total|Realized|P/L|Profit|Loss)", h, re.I)
-        ]
+        numeric_cols = [i for i, h in enumerate(header) if _PL_COLUMN_RE.search(h)]
         candidate_cols = numeric_cols or list(
             range(max(0, len(header) - 10), len(header))
         )
@@ -70,7 +77,7 @@ def reconcile_with_ibkr_summary(model: IbkrModel) -> dict[str, Decimal]:
             sym = (
                 r.get(header[idx_symbol], "").strip() if idx_symbol is not None else ""
             )
-            if not sym:
+            if not sym or (symbols is not None and sym not in symbols):
                 continue
 
             # try columns from right to left for a parseable number
@@ -93,7 +100,7 @@ def reconcile_with_ibkr_summary(model: IbkrModel) -> dict[str, Decimal]:
                     found_col,
                     header[found_col],
                 )
-                result[sym] = result.get(sym, Decimal("0")) + val
+                result[sym] = result.get(sym, _ZERO) + val
 
     logger.debug("Reconciliation parsed %d symbols from IBKR summary", len(result))
     return result
@@ -10,20 +10,24 @@ from .extract import DividendRow, InterestRow, SyepInterestRow, WithholdingRow
 from .fifo import RealizedLine
 from .fifo_domain import SellMatchLeg, TransferProtocol
 from .fx import FxTable
+from .money import quantize_money
 
 logger = logging.getLogger(__name__)
 
+# Decimal is immutable, so one shared zero serves every accumulator start value
+_ZERO = Decimal("0")
 
-@dataclass
+
+@dataclass(slots=True)
 class CurrencyTotals:
     """Aggregated monetary totals for a single currency."""
 
-    realized: Decimal = field(default_factory=lambda: Decimal("0"))
-    proceeds: Decimal = field(default_factory=lambda: Decimal("0"))
-    alloc_cost: Decimal = field(default_factory=lambda: Decimal("0"))
+    realized: Decimal = _ZERO
+    proceeds: Decimal = _ZERO
+    alloc_cost: Decimal = _ZERO
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolTotals:
     """Aggregated totals for a symbol across currencies."""
 
@@ -32,9 +36,10 @@ class SymbolTotals:
 
     def get_currency(self, currency: str) -> CurrencyTotals:
         """Get or create currency totals."""
-        if currency not in self.by_currency:
-            self.by_currency[currency] = CurrencyTotals()
-        return self.by_currency[currency]
+        totals = self.by_currency.get(currency)
+        if totals is None:
+            totals = self.by_currency[currency] = CurrencyTotals()
+        return totals
 
 
 @dataclass
@@ -55,18 +60,23 @@ class ReportBuilder:
     def add_realized(self, rl: RealizedLine) -> None:
         self.realized_lines.append(rl)
         # aggregate per symbol
-        if rl.symbol not in self.symbol_totals:
-            self.symbol_totals[rl.symbol] = SymbolTotals()
-        t = self.symbol_totals[rl.symbol]
+        t = self._totals_for(rl.symbol)
         ccy = t.get_currency(rl.currency)
         ccy.realized += rl.realized_pl_ccy
         ccy.proceeds += rl.sell_net_ccy
-        ccy.alloc_cost += sum((leg.alloc_cost_ccy for leg in rl.legs), Decimal("0"))
+        ccy.alloc_cost += rl.alloc_cost_ccy
         # EUR aggregations if present
         if rl.realized_pl_eur is not None:
             t.eur.realized += rl.realized_pl_eur
-            t.eur.proceeds += rl.sell_net_eur or Decimal("0")
-            t.eur.alloc_cost += rl.alloc_cost_eur or Decimal("0")
+            t.eur.proceeds += rl.sell_net_eur or _ZERO
+            t.eur.alloc_cost += rl.alloc_cost_eur or _ZERO
+
+    def _totals_for(self, symbol: str) -> SymbolTotals:
+        """Get or create the totals for a symbol with a single lookup on hits."""
+        totals = self.symbol_totals.get(symbol)
+        if totals is None:
+            totals = self.symbol_totals[symbol] = SymbolTotals()
+        return totals
 
     def set_dividends(self, rows: list[DividendRow]) -> None:
         self.dividends = rows
@@ -97,66 +107,76 @@ class ReportBuilder:
         self._recompute_aggregates()
 
     def _convert_realized_lines(self, fx: FxTable | None) -> None:
+        # FxTable already keeps per-currency parallel date/rate arrays behind a
+        # memoized lookup, so the per-line work left here is the Decimal math.
+        convert_eur = self._convert_realized_line_eur
+        if fx is None:
+            for rl in self.realized_lines:
+                if rl.currency == "EUR":
+                    convert_eur(rl)
+                else:
+                    self.fx_missing = True
+            return
+        convert_fx = self._convert_realized_line_fx
         for rl in self.realized_lines:
             if rl.currency == "EUR":
-                self._convert_realized_line_eur(rl)
-            elif fx is not None:
-                self._convert_realized_line_fx(rl, fx)
+                convert_eur(rl)
             else:
-                self.fx_missing = True
+                convert_fx(rl, fx)
 
     def _convert_realized_line_eur(self, rl: RealizedLine) -> None:
         rl.sell_gross_eur = rl.sell_gross_ccy
         rl.sell_comm_eur = rl.sell_comm_ccy
         rl.sell_net_eur = rl.sell_net_ccy
-        alloc_eur = Decimal("0")
+        alloc_eur = _ZERO
         # per-leg EUR breakdown (identity conversion)
         for leg in rl.legs:
             leg.alloc_cost_eur = leg.alloc_cost_ccy
             alloc_eur += leg.alloc_cost_eur
-        rl.alloc_cost_eur = alloc_eur.quantize(Decimal("0.01"))
-        rl.realized_pl_eur = (rl.sell_net_eur - rl.alloc_cost_eur).quantize(
-            Decimal("0.01")
-        )
+        rl.alloc_cost_eur = quantize_money(alloc_eur)
+        rl.realized_pl_eur = quantize_money(rl.sell_net_eur - rl.alloc_cost_eur)
         self._allocate_proceeds_to_legs(rl.legs, rl.sell_qty, rl.sell_net_eur)
 
     def _convert_realized_line_fx(self, rl: RealizedLine, fx: FxTable) -> None:
-        sell_rate = fx.get_rate(rl.sell_date, rl.currency)
+        get_rate = fx.get_rate
+        ccy = rl.currency
+        sell_rate = get_rate(rl.sell_date, ccy)
         if sell_rate is None:
             logger.debug(
                 "Sell FX rate missing for %s on %s, proceeds marked as missing",
-                rl.currency,
+                ccy,
                 rl.sell_date,
             )
             self.fx_missing = True
             return
 
-        proceeds_eur = (rl.sell_gross_ccy * sell_rate).quantize(Decimal("0.01"))
-        logger.debug(
-            "Sell FX conversion: %s %s: EUR (rate: %s) = %s EUR",
-            rl.sell_gross_ccy,
-            rl.currency,
-            sell_rate,
-            proceeds_eur,
-        )
+        proceeds_eur = quantize_money(rl.sell_gross_ccy * sell_rate)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Sell FX conversion: %s %s: EUR (rate: %s) = %s EUR",
+                rl.sell_gross_ccy,
+                ccy,
+                sell_rate,
+                proceeds_eur,
+            )
 
         rl.sell_gross_eur = proceeds_eur
-        rl.sell_comm_eur = (rl.sell_comm_ccy * sell_rate).quantize(Decimal("0.01"))
-        rl.sell_net_eur = (rl.sell_net_ccy * sell_rate).quantize(Decimal("0.01"))
+        rl.sell_comm_eur = quantize_money(rl.sell_comm_ccy * sell_rate)
+        rl.sell_net_eur = quantize_money(rl.sell_net_ccy * sell_rate)
 
-        alloc_eur = Decimal("0")
+        alloc_eur = _ZERO
+        # Buy-date rates repeat heavily across legs; FxTable memoizes each
+        # (date, currency) resolution, so only the first leg per date pays a bisect.
         for leg in rl.legs:
             bd = leg.buy_date
             rate = sell_rate  # fallback
             if bd is not None:
-                rate = fx.get_rate(bd, rl.currency) or sell_rate
-            leg_eur = (leg.alloc_cost_ccy * rate).quantize(Decimal("0.01"))
+                rate = get_rate(bd, ccy) or sell_rate
+            leg_eur = quantize_money(leg.alloc_cost_ccy * rate)
             leg.alloc_cost_eur = leg_eur
             alloc_eur += leg_eur
-        rl.alloc_cost_eur = alloc_eur.quantize(Decimal("0.01"))
-        rl.realized_pl_eur = (rl.sell_net_eur - rl.alloc_cost_eur).quantize(
-            Decimal("0.01")
-        )
+        rl.alloc_cost_eur = quantize_money(alloc_eur)
+        rl.realized_pl_eur = quantize_money(rl.sell_net_eur - rl.alloc_cost_eur)
         self._allocate_proceeds_to_legs(rl.legs, rl.sell_qty, rl.sell_net_eur)
 
     @staticmethod
@@ -171,10 +191,9 @@ class ReportBuilder:
         """
         if sell_qty == 0 or sell_net_eur is None or not legs:
             return
-        cent = Decimal("0.01")
-        allocated = Decimal("0")
+        allocated = _ZERO
         for leg in legs[:-1]:
-            leg.proceeds_share_eur = (sell_net_eur * leg.qty / sell_qty).quantize(cent)
+            leg.proceeds_share_eur = quantize_money(sell_net_eur * leg.qty / sell_qty)
             allocated += leg.proceeds_share_eur
         legs[-1].proceeds_share_eur = sell_net_eur - allocated
 
@@ -224,7 +243,7 @@ class ReportBuilder:
         cur = currency.upper()
 
         if cur == "EUR":
-            return amount.quantize(Decimal("0.01"))
+            return quantize_money(amount)
 
         if fx is None or date is None:
             self.fx_missing = True
@@ -235,7 +254,7 @@ class ReportBuilder:
             self.fx_missing = True
             return None
 
-        return (amount * rate).quantize(Decimal("0.01"))
+        return quantize_money(amount * rate)
 
     def _recompute_aggregates(self) -> None:
         # Recompute EUR aggregates per symbol after conversions
@@ -244,9 +263,7 @@ class ReportBuilder:
             totals.eur = CurrencyTotals()
 
         for rl in self.realized_lines:
-            if rl.symbol not in self.symbol_totals:
-                self.symbol_totals[rl.symbol] = SymbolTotals()
-            t = self.symbol_totals[rl.symbol]
+            t = self._totals_for(rl.symbol)
             if rl.realized_pl_eur is not None:
                 t.eur.realized += rl.realized_pl_eur
             if rl.sell_net_eur is not None:
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-import json
+import functools
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from decimal import Decimal
+from operator import attrgetter
 from pathlib import Path
-from typing import Protocol
+from typing import Any, Protocol
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.worksheet import Worksheet
 
+from .fifo_domain import SellMatchLeg
 from .report_builder import ReportBuilder
 
 # Column ranges for realized trades sheet formatting (1-indexed Excel columns)
@@ -18,6 +21,43 @@ from .report_builder import ReportBuilder
 #          net_eur(12), alloc_eur(13), pl_eur(14), legs_json(15)
 _REALIZED_TCY_MONEY_COLS = range(5, 10)  # Trade currency columns (gross..pl)
 _REALIZED_EUR_MONEY_COLS = range(10, 15)  # EUR columns (gross..pl)
+_CENT = Decimal("0.01")
+_ZERO = Decimal("0")
+
+# A sheet row: cell values plus number formats keyed by 1-based column.
+_Row = tuple[list[Any], dict[int, str]]
+
+_CURRENCY_SYMBOLS = {"USD": "$", "EUR": "€", "GBP": "£", "JPY": "¥"}
+
+
+def _legs_json(legs: list[SellMatchLeg]) -> str:
+    """Serialize legs exactly as json.dumps would, without the generic encoder.
+
+    The schema is fixed and every value is either null, an ISO date or a Decimal
+    string, none of which need escaping.
+    """
+    parts = []
+    for ld in legs:
+        buy_date = f'"{ld.buy_date.isoformat()}"' if ld.buy_date else "null"
+        parts.append(
+            f'{{"buy_date": {buy_date}, "qty": "{ld.qty}", '
+            f'"alloc_cost_ccy": "{ld.alloc_cost_ccy}"}}'
+        )
+    return "[" + ", ".join(parts) + "]"
+
+
+@functools.lru_cache(maxsize=64)
+def _money_fmt(loc: str, ccy: str) -> str:
+    """Excel money format for a currency; cached since sheets ask once per row."""
+    cur = (ccy or "").upper()
+    sym = _CURRENCY_SYMBOLS.get(cur)
+    if sym:
+        if cur == "EUR" and loc == "PT":
+            return f'#,##0.00 "{sym}"'
+        return f"{sym}#,##0.00"
+    if loc == "PT":
+        return f'#,##0.00 "{cur}"'
+    return f'"{cur}" #,##0.00'
 
 
 class ReportSink(Protocol):
@@ -250,12 +290,9 @@ class ExcelReportSink:
 
     def write(self, report: ReportBuilder) -> Path:
         out_path = Path(self.out_path)
-        wb = Workbook()
-
-        # Remove the default sheet
-        ws_default = wb.active
-        if ws_default is not None:
-            wb.remove(ws_default)
+        # Write-only workbooks stream each sheet's rows to disk as they are appended
+        # instead of keeping a Cell object per value in memory until save().
+        wb = Workbook(write_only=True)
 
         labels = self._labels()
 
@@ -269,9 +306,6 @@ class ExcelReportSink:
         self._write_withholding(wb, report, labels)
         self._write_transfers(wb, report, labels)
 
-        for _ws in wb.worksheets:
-            self._autosize(_ws)
-
         out_path.parent.mkdir(parents=True, exist_ok=True)
         wb.save(out_path)
         return out_path
@@ -279,92 +313,73 @@ class ExcelReportSink:
     def _write_summary(
         self, wb: Workbook, report: ReportBuilder, labels: dict[str, dict[str, str]]
     ) -> None:
-        # Summary sheet (totals)
-        ws = wb.create_sheet(title=labels["sheet"]["summary"])
-        total_eur = sum(
-            (rl.realized_pl_eur or Decimal("0") for rl in report.realized_lines),
-            Decimal("0"),
-        )
-        proceeds_total_eur = sum(
-            (rl.sell_net_eur or Decimal("0") for rl in report.realized_lines),
-            Decimal("0"),
-        )
-        alloc_total_eur = sum(
-            (rl.alloc_cost_eur or Decimal("0") for rl in report.realized_lines),
-            Decimal("0"),
-        )
-
+        # Summary sheet (totals), accumulated in a single pass over realized lines
+        total_eur = _ZERO
+        proceeds_total_eur = _ZERO
+        alloc_total_eur = _ZERO
         totals_by_cur: dict[str, Decimal] = {}
         for rl in report.realized_lines:
+            total_eur += rl.realized_pl_eur or _ZERO
+            proceeds_total_eur += rl.sell_net_eur or _ZERO
+            alloc_total_eur += rl.alloc_cost_eur or _ZERO
             # Exclude EUR from by-currency totals to avoid duplicate label confusion
             if rl.currency == "EUR":
                 continue
             totals_by_cur[rl.currency] = (
-                totals_by_cur.get(rl.currency, Decimal("0")) + rl.realized_pl_ccy
+                totals_by_cur.get(rl.currency, _ZERO) + rl.realized_pl_ccy
             )
-        ws.append([labels["summary"]["metric"], labels["summary"]["amount"]])
 
-        # Primary EUR totals
-        ws.append([labels["summary"]["total_eur"], float(total_eur)])
-        ws.cell(row=ws.max_row, column=2).number_format = self._money_fmt_for_currency(
-            "EUR"
-        )
-        ws.append([labels["summary"]["proceeds_eur"], float(proceeds_total_eur)])
-        ws.cell(row=ws.max_row, column=2).number_format = self._money_fmt_for_currency(
-            "EUR"
-        )
-        ws.append([labels["summary"]["alloc_eur"], float(alloc_total_eur)])
-        ws.cell(row=ws.max_row, column=2).number_format = self._money_fmt_for_currency(
-            "EUR"
-        )
+        eur_fmt = {2: self._money_fmt_for_currency("EUR")}
+        rows: list[_Row] = [
+            ([labels["summary"]["total_eur"], float(total_eur)], eur_fmt),
+            ([labels["summary"]["proceeds_eur"], float(proceeds_total_eur)], eur_fmt),
+            ([labels["summary"]["alloc_eur"], float(alloc_total_eur)], eur_fmt),
+        ]
         for cur, amt in sorted(totals_by_cur.items()):
-            ws.append([labels["summary"]["total_cur_tpl"].format(cur=cur), float(amt)])
-            ws.cell(
-                row=ws.max_row, column=2
-            ).number_format = self._money_fmt_for_currency(cur)
+            rows.append(
+                (
+                    [labels["summary"]["total_cur_tpl"].format(cur=cur), float(amt)],
+                    {2: self._money_fmt_for_currency(cur)},
+                )
+            )
+        self._emit_sheet(
+            wb,
+            labels["sheet"]["summary"],
+            [labels["summary"]["metric"], labels["summary"]["amount"]],
+            lambda: rows,
+        )
 
     def _write_realized(
         self, wb: Workbook, report: ReportBuilder, labels: dict[str, dict[str, str]]
     ) -> None:
         # Realized trades sheet
-        ws = wb.create_sheet(title=labels["sheet"]["realized"])
-        ws.append(
-            [
-                labels["realized"]["ticker"],
-                labels["realized"]["trade_currency"],
-                labels["realized"]["sell_date"],
-                labels["realized"]["qty_sold"],
-                labels["realized"]["gross_tcy"],
-                labels["realized"]["fees_tcy"],
-                labels["realized"]["net_tcy"],
-                labels["realized"]["alloc_tcy"],
-                labels["realized"]["pl_tcy"],
-                labels["realized"]["gross_eur"],
-                labels["realized"]["fees_eur"],
-                labels["realized"]["net_eur"],
-                labels["realized"]["alloc_eur"],
-                labels["realized"]["pl_eur"],
-                labels["realized"]["legs_json"],
-            ]
-        )
+        header = [
+            labels["realized"]["ticker"],
+            labels["realized"]["trade_currency"],
+            labels["realized"]["sell_date"],
+            labels["realized"]["qty_sold"],
+            labels["realized"]["gross_tcy"],
+            labels["realized"]["fees_tcy"],
+            labels["realized"]["net_tcy"],
+            labels["realized"]["alloc_tcy"],
+            labels["realized"]["pl_tcy"],
+            labels["realized"]["gross_eur"],
+            labels["realized"]["fees_eur"],
+            labels["realized"]["net_eur"],
+            labels["realized"]["alloc_eur"],
+            labels["realized"]["pl_eur"],
+            labels["realized"]["legs_json"],
+        ]
 
         date_fmt = self._date_format
         qty_fmt = "0.########"
+        eur_fmt = self._money_fmt_for_currency("EUR")
 
-        for rl in report.realized_lines:
-            alloc_cost_ccy = sum((leg.alloc_cost_ccy for leg in rl.legs), Decimal("0"))
-            legs_json = json.dumps(
-                [
-                    {
-                        "buy_date": (ld.buy_date.isoformat() if ld.buy_date else None),
-                        "qty": str(ld.qty),
-                        "alloc_cost_ccy": str(ld.alloc_cost_ccy),
-                    }
-                    for ld in rl.legs
-                ]
-            )
-            ws.append(
-                [
+        def rows() -> Iterator[_Row]:
+            fmts_by_ccy: dict[str, dict[int, str]] = {}
+            for rl in report.realized_lines:
+                legs_json = _legs_json(rl.legs)
+                values = [
                     rl.symbol,
                     rl.currency,
                     rl.sell_date,
@@ -372,7 +387,7 @@ class ExcelReportSink:
                     float(rl.sell_gross_ccy),
                     float(rl.sell_comm_ccy),
                     float(rl.sell_net_ccy),
-                    float(alloc_cost_ccy),
+                    float(rl.alloc_cost_ccy),
                     float(rl.realized_pl_ccy),
                     (None if rl.sell_gross_eur is None else float(rl.sell_gross_eur)),
                     (None if rl.sell_comm_eur is None else float(rl.sell_comm_eur)),
@@ -381,50 +396,57 @@ class ExcelReportSink:
                     (None if rl.realized_pl_eur is None else float(rl.realized_pl_eur)),
                     legs_json,
                 ]
-            )
-            r = ws.max_row
-            ws.cell(row=r, column=3).number_format = date_fmt
-            ws.cell(row=r, column=4).number_format = qty_fmt
-            tcy_fmt = self._money_fmt_for_currency(rl.currency)
-            for c in _REALIZED_TCY_MONEY_COLS:
-                ws.cell(row=r, column=c).number_format = tcy_fmt
-            eur_fmt = self._money_fmt_for_currency("EUR")
-            for c in _REALIZED_EUR_MONEY_COLS:
-                ws.cell(row=r, column=c).number_format = eur_fmt
+                # Rows of the same trade currency share one read-only format map
+                fmts = fmts_by_ccy.get(rl.currency)
+                if fmts is None:
+                    tcy_fmt = self._money_fmt_for_currency(rl.currency)
+                    fmts = {3: date_fmt, 4: qty_fmt}
+                    fmts.update(dict.fromkeys(_REALIZED_TCY_MONEY_COLS, tcy_fmt))
+                    fmts.update(dict.fromkeys(_REALIZED_EUR_MONEY_COLS, eur_fmt))
+                    fmts_by_ccy[rl.currency] = fmts
+                yield values, fmts
+
+        self._emit_sheet(wb, labels["sheet"]["realized"], header, rows)
 
     def _write_anexo_j(
         self, wb: Workbook, report: ReportBuilder, labels: dict[str, dict[str, str]]
     ) -> None:
         # Annex J helper (per-leg breakdown with EUR values)
-        ws = wb.create_sheet(title=labels["sheet"]["anexo_j"])
-        ws.append(
-            [
-                labels["anexo_j"]["ticker"],
-                labels["anexo_j"]["trade_currency"],
-                labels["anexo_j"]["buy_date"],
-                labels["anexo_j"]["sell_date"],
-                labels["anexo_j"]["qty"],
-                labels["anexo_j"]["alloc_eur"],
-                labels["anexo_j"]["proceeds_eur"],
-                labels["anexo_j"]["pl_eur"],
-                labels["anexo_j"]["transferred"],
-            ]
-        )
+        header = [
+            labels["anexo_j"]["ticker"],
+            labels["anexo_j"]["trade_currency"],
+            labels["anexo_j"]["buy_date"],
+            labels["anexo_j"]["sell_date"],
+            labels["anexo_j"]["qty"],
+            labels["anexo_j"]["alloc_eur"],
+            labels["anexo_j"]["proceeds_eur"],
+            labels["anexo_j"]["pl_eur"],
+            labels["anexo_j"]["transferred"],
+        ]
 
         date_fmt = self._date_format
         qty_fmt = "0.########"
+        eur_fmt = self._money_fmt_for_currency("EUR")
+        fmts = {
+            3: date_fmt,
+            4: date_fmt,
+            5: qty_fmt,
+            6: eur_fmt,
+            7: eur_fmt,
+            8: eur_fmt,
+        }
 
-        for rl in report.realized_lines:
-            for leg in rl.legs:
-                alloc_eur = leg.alloc_cost_eur
-                proceeds_eur = leg.proceeds_share_eur
-                pl_eur = None
-                if alloc_eur is not None and proceeds_eur is not None:
-                    pl_eur = (proceeds_eur - alloc_eur).quantize(Decimal("0.01"))
-                # Check if lot was from a transfer
-                is_transferred = leg.transferred
-                ws.append(
-                    [
+        def rows() -> Iterator[_Row]:
+            for rl in report.realized_lines:
+                for leg in rl.legs:
+                    alloc_eur = leg.alloc_cost_eur
+                    proceeds_eur = leg.proceeds_share_eur
+                    pl_eur = None
+                    if alloc_eur is not None and proceeds_eur is not None:
+                        pl_eur = (proceeds_eur - alloc_eur).quantize(_CENT)
+                    # Check if lot was from a transfer
+                    is_transferred = leg.transferred
+                    values = [
                         rl.symbol,
                         rl.currency,
                         leg.buy_date,
@@ -435,161 +457,152 @@ class ExcelReportSink:
                         (None if pl_eur is None else float(pl_eur)),
                         "Yes" if is_transferred else "",
                     ]
-                )
-                r = ws.max_row
-                ws.cell(row=r, column=3).number_format = date_fmt
-                ws.cell(row=r, column=4).number_format = date_fmt
-                ws.cell(row=r, column=5).number_format = qty_fmt
-                for c in (6, 7, 8):
-                    ws.cell(
-                        row=r, column=c
-                    ).number_format = self._money_fmt_for_currency("EUR")
+                    yield values, fmts
+
+        self._emit_sheet(wb, labels["sheet"]["anexo_j"], header, rows)
 
     def _write_per_symbol(
         self, wb: Workbook, report: ReportBuilder, labels: dict[str, dict[str, str]]
     ) -> None:
         # Per-symbol summary (trade currency + EUR)
-        ws = wb.create_sheet(title=labels["sheet"]["per_symbol"])
-        ws.append(
-            [
-                labels["per_symbol"]["ticker"],
-                labels["per_symbol"]["trade_currency"],
-                labels["per_symbol"]["pl_tcy"],
-                labels["per_symbol"]["net_tcy"],
-                labels["per_symbol"]["alloc_tcy"],
-                labels["per_symbol"]["pl_eur"],
-                labels["per_symbol"]["net_eur"],
-                labels["per_symbol"]["alloc_eur"],
-            ]
-        )
+        header = [
+            labels["per_symbol"]["ticker"],
+            labels["per_symbol"]["trade_currency"],
+            labels["per_symbol"]["pl_tcy"],
+            labels["per_symbol"]["net_tcy"],
+            labels["per_symbol"]["alloc_tcy"],
+            labels["per_symbol"]["pl_eur"],
+            labels["per_symbol"]["net_eur"],
+            labels["per_symbol"]["alloc_eur"],
+        ]
+        eur_fmt = self._money_fmt_for_currency("EUR")
 
         # Invariant: each symbol maps to exactly one trade currency
         # (enforced by validate_symbol_currency_uniqueness at ingestion).
-        for symbol, totals in sorted(report.symbol_totals.items()):
-            ccy, ccy_totals = next(iter(totals.by_currency.items()))
-            row = [
-                symbol,
-                ccy,
-                float(ccy_totals.realized),
-                float(ccy_totals.proceeds),
-                float(ccy_totals.alloc_cost),
-                float(totals.eur.realized),
-                float(totals.eur.proceeds),
-                float(totals.eur.alloc_cost),
-            ]
-            ws.append(row)
-
-            r = ws.max_row
-            # Money formats for trade currency values
-            tcy_fmt = self._money_fmt_for_currency(ccy)
-            for c in (3, 4, 5):
-                ws.cell(row=r, column=c).number_format = tcy_fmt
-            for c in (6, 7, 8):
-                ws.cell(row=r, column=c).number_format = self._money_fmt_for_currency(
-                    "EUR"
-                )
+        def rows() -> Iterator[_Row]:
+            for symbol, totals in sorted(report.symbol_totals.items()):
+                ccy, ccy_totals = next(iter(totals.by_currency.items()))
+                values = [
+                    symbol,
+                    ccy,
+                    float(ccy_totals.realized),
+                    float(ccy_totals.proceeds),
+                    float(ccy_totals.alloc_cost),
+                    float(totals.eur.realized),
+                    float(totals.eur.proceeds),
+                    float(totals.eur.alloc_cost),
+                ]
+                # Money formats for trade currency values, then EUR
+                tcy_fmt = self._money_fmt_for_currency(ccy)
+                fmts = {
+                    3: tcy_fmt,
+                    4: tcy_fmt,
+                    5: tcy_fmt,
+                    6: eur_fmt,
+                    7: eur_fmt,
+                    8: eur_fmt,
+                }
+                yield values, fmts
+
+        self._emit_sheet(wb, labels["sheet"]["per_symbol"], header, rows)
 
     def _write_dividends(
         self, wb: Workbook, report: ReportBuilder, labels: dict[str, dict[str, str]]
     ) -> None:
         if not report.dividends:
             return
-        ws = wb.create_sheet(title=labels["sheet"]["dividends"])
-        ws.append(
-            [
-                labels["dividends"]["date"],
-                labels["dividends"]["currency"],
-                labels["dividends"]["desc"],
-                labels["dividends"]["amount"],
-                labels["dividends"]["amount_eur"],
-            ]
-        )
+        header = [
+            labels["dividends"]["date"],
+            labels["dividends"]["currency"],
+            labels["dividends"]["desc"],
+            labels["dividends"]["amount"],
+            labels["dividends"]["amount_eur"],
+        ]
         sorted_divs = sorted(report.dividends, key=lambda row: row.description.lower())
         date_fmt = self._date_format
+        eur_fmt = self._money_fmt_for_currency("EUR")
 
-        for d in sorted_divs:
-            ws.append(
-                [
+        def rows() -> Iterator[_Row]:
+            for d in sorted_divs:
+                values = [
                     d.date,
                     d.currency,
                     d.description,
                     float(d.amount),
                     (None if d.amount_eur is None else float(d.amount_eur)),
                 ]
-            )
-            r = ws.max_row
-            ws.cell(row=r, column=1).number_format = date_fmt
-            ws.cell(row=r, column=4).number_format = self._money_fmt_for_currency(
-                d.currency
-            )
-            ws.cell(row=r, column=5).number_format = self._money_fmt_for_currency("EUR")
+                fmts = {
+                    1: date_fmt,
+                    4: self._money_fmt_for_currency(d.currency),
+                    5: eur_fmt,
+                }
+                yield values, fmts
+
+        self._emit_sheet(wb, labels["sheet"]["dividends"], header, rows)
 
     def _write_interest(
         self, wb: Workbook, report: ReportBuilder, labels: dict[str, dict[str, str]]
     ) -> None:
         if not report.interest:
             return
-        ws = wb.create_sheet(title=labels["sheet"]["interest"])
-        ws.append(
-            [
-                labels["interest"]["date"],
-                labels["interest"]["currency"],
-                labels["interest"]["desc"],
-                labels["interest"]["amount"],
-                labels["interest"]["amount_eur"],
-            ]
-        )
+        header = [
+            labels["interest"]["date"],
+            labels["interest"]["currency"],
+            labels["interest"]["desc"],
+            labels["interest"]["amount"],
+            labels["interest"]["amount_eur"],
+        ]
         sorted_interest = sorted(
             report.interest,
             key=lambda row: row.description.lower(),
         )
         date_fmt = self._date_format
+        eur_fmt = self._money_fmt_for_currency("EUR")
 
-        for d in sorted_interest:
-            ws.append(
-                [
+        def rows() -> Iterator[_Row]:
+            for d in sorted_interest:
+                values = [
                     d.date,
                     d.currency,
                     d.description,
                     float(d.amount),
                     (None if d.amount_eur is None else float(d.amount_eur)),
                 ]
-            )
-            r = ws.max_row
-            ws.cell(row=r, column=1).number_format = date_fmt
-            ws.cell(row=r, column=4).number_format = self._money_fmt_for_currency(
-                d.currency
-            )
-            ws.cell(row=r, column=5).number_format = self._money_fmt_for_currency("EUR")
+                fmts = {
+                    1: date_fmt,
+                    4: self._money_fmt_for_currency(d.currency),
+                    5: eur_fmt,
+                }
+                yield values, fmts
+
+        self._emit_sheet(wb, labels["sheet"]["interest"], header, rows)
 
     def _write_syep_interest(
         self, wb: Workbook, report: ReportBuilder, labels: dict[str, dict[str, str]]
     ) -> None:
         if not report.syep_interest:
             return
-        ws = wb.create_sheet(title=labels["sheet"]["syep_interest"])
-        ws.append(
-            [
-                labels["syep"]["date"],
-                labels["syep"]["currency"],
-                labels["syep"]["symbol"],
-                labels["syep"]["start_date"],
-                labels["syep"]["quantity"],
-                labels["syep"]["collateral"],
-                labels["syep"]["market_rate"],
-                labels["syep"]["customer_rate"],
-                labels["syep"]["interest_paid"],
-                labels["syep"]["interest_paid_eur"],
-                labels["syep"]["code"],
-            ]
-        )
+        header = [
+            labels["syep"]["date"],
+            labels["syep"]["currency"],
+            labels["syep"]["symbol"],
+            labels["syep"]["start_date"],
+            labels["syep"]["quantity"],
+            labels["syep"]["collateral"],
+            labels["syep"]["market_rate"],
+            labels["syep"]["customer_rate"],
+            labels["syep"]["interest_paid"],
+            labels["syep"]["interest_paid_eur"],
+            labels["syep"]["code"],
+        ]
         pct_fmt = "0.00####"
         date_fmt = self._date_format
         qty_fmt = "0.########"
+        eur_fmt = self._money_fmt_for_currency("EUR")
 
-        for row in report.syep_interest:
-            ws.append(
-                [
+        def rows() -> Iterator[_Row]:
+            for row in report.syep_interest:
+                values = [
                     row.value_date,
                     row.currency,
                     row.symbol,
@@ -606,40 +619,35 @@ class ExcelReportSink:
                     ),
                     row.code,
                 ]
-            )
-            r = ws.max_row
-            ws.cell(row=r, column=1).number_format = date_fmt
-            ws.cell(row=r, column=4).number_format = date_fmt
-            ws.cell(row=r, column=5).number_format = qty_fmt
-            ws.cell(row=r, column=6).number_format = self._money_fmt_for_currency(
-                row.currency
-            )
-            ws.cell(row=r, column=7).number_format = pct_fmt
-            ws.cell(row=r, column=8).number_format = pct_fmt
-            ws.cell(row=r, column=9).number_format = self._money_fmt_for_currency(
-                row.currency
-            )
-            ws.cell(row=r, column=10).number_format = self._money_fmt_for_currency(
-                "EUR"
-            )
+                ccy_fmt = self._money_fmt_for_currency(row.currency)
+                fmts = {
+                    1: date_fmt,
+                    4: date_fmt,
+                    5: qty_fmt,
+                    6: ccy_fmt,
+                    7: pct_fmt,
+                    8: pct_fmt,
+                    9: ccy_fmt,
+                    10: eur_fmt,
+                }
+                yield values, fmts
+
+        self._emit_sheet(wb, labels["sheet"]["syep_interest"], header, rows)
 
     def _write_withholding(
         self, wb: Workbook, report: ReportBuilder, labels: dict[str, dict[str, str]]
     ) -> None:
         if not report.withholding:
             return
-        ws = wb.create_sheet(title=labels["sheet"]["withholding"])
-        ws.append(
-            [
-                labels["withholding"]["date"],
-                labels["withholding"]["currency"],
-                labels["withholding"]["desc"],
-                labels["withholding"]["type"],
-                labels["withholding"]["country"],
-                labels["withholding"]["amount"],
-                labels["withholding"]["amount_eur"],
-            ]
-        )
+        header = [
+            labels["withholding"]["date"],
+            labels["withholding"]["currency"],
+            labels["withholding"]["desc"],
+            labels["withholding"]["type"],
+            labels["withholding"]["country"],
+            labels["withholding"]["amount"],
+            labels["withholding"]["amount_eur"],
+        ]
         sorted_withholding = sorted(
             report.withholding,
             key=lambda row: (
@@ -648,10 +656,11 @@ class ExcelReportSink:
             ),
         )
         date_fmt = self._date_format
+        eur_fmt = self._money_fmt_for_currency("EUR")
 
-        for d in sorted_withholding:
-            ws.append(
-                [
+        def rows() -> Iterator[_Row]:
+            for d in sorted_withholding:
+                values = [
                     d.date,
                     d.currency,
                     d.description,
@@ -660,41 +669,36 @@ class ExcelReportSink:
                     float(d.amount),
                     (None if d.amount_eur is None else float(d.amount_eur)),
                 ]
-            )
-            r = ws.max_row
-            ws.cell(row=r, column=1).number_format = date_fmt
-            ws.cell(row=r, column=6).number_format = self._money_fmt_for_currency(
-                d.currency
-            )
-            ws.cell(row=r, column=7).number_format = self._money_fmt_for_currency("EUR")
+                fmts = {
+                    1: date_fmt,
+                    6: self._money_fmt_for_currency(d.currency),
+                    7: eur_fmt,
+                }
+                yield values, fmts
+
+        self._emit_sheet(wb, labels["sheet"]["withholding"], header, rows)
 
     def _write_transfers(
         self, wb: Workbook, report: ReportBuilder, labels: dict[str, dict[str, str]]
     ) -> None:
         if not report.transfers:
             return
-        ws = wb.create_sheet(title=labels["sheet"]["transfers"])
-        ws.append(
-            [
-                labels["transfers"]["date"],
-                labels["transfers"]["symbol"],
-                labels["transfers"]["direction"],
-                labels["transfers"]["quantity"],
-                labels["transfers"]["currency"],
-                labels["transfers"]["market_value"],
-                labels["transfers"]["code"],
-            ]
-        )
-        sorted_transfers = sorted(
-            report.transfers,
-            key=lambda t: (t.date, t.symbol),
-        )
+        header = [
+            labels["transfers"]["date"],
+            labels["transfers"]["symbol"],
+            labels["transfers"]["direction"],
+            labels["transfers"]["quantity"],
+            labels["transfers"]["currency"],
+            labels["transfers"]["market_value"],
+            labels["transfers"]["code"],
+        ]
+        sorted_transfers = sorted(report.transfers, key=attrgetter("date", "symbol"))
         date_fmt = self._date_format
         qty_fmt = "0.########"
 
-        for t in sorted_transfers:
-            ws.append(
-                [
+        def rows() -> Iterator[_Row]:
+            for t in sorted_transfers:
+                values = [
                     t.date,
                     t.symbol,
                     t.direction,
@@ -703,53 +707,71 @@ class ExcelReportSink:
                     float(t.market_value),
                     t.code,
                 ]
-            )
-            r = ws.max_row
-            ws.cell(row=r, column=1).number_format = date_fmt
-            ws.cell(row=r, column=4).number_format = qty_fmt
-            ws.cell(row=r, column=6).number_format = self._money_fmt_for_currency(
-                t.currency
-            )
+                fmts = {
+                    1: date_fmt,
+                    4: qty_fmt,
+                    6: self._money_fmt_for_currency(t.currency),
+                }
+                yield values, fmts
+
+        self._emit_sheet(wb, labels["sheet"]["transfers"], header, rows)
 
     def _money_fmt_for_currency(self, ccy: str) -> str:
-        loc = self.locale.upper()
-        cur = (ccy or "").upper()
-        symbols = {"USD": "$", "EUR": "€", "GBP": "£", "JPY": "¥"}
-        sym = symbols.get(cur)
-        if sym:
-            if cur == "EUR" and loc == "PT":
-                return f'#,##0.00 "{sym}"'
-            return f"{sym}#,##0.00"
-        if loc == "PT":
-            return f'#,##0.00 "{cur}"'
-        return f'"{cur}" #,##0.00'
+        return _money_fmt(self.locale.upper(), ccy)
+
+    def _emit_sheet(
+        self,
+        wb: Workbook,
+        title: str,
+        header: list[str],
+        rows: Callable[[], Iterable[_Row]],
+    ) -> None:
+        """Create a sheet and stream its header and rows into it.
+
+        Column widths must be set on a write-only sheet before the first row is
+        appended, so `rows` is called twice: once to size the columns and once to
+        write.  Neither pass keeps the sheet's rows in memory.
+        """
+        ws = wb.create_sheet(title=title)
+        self._autosize(ws, header, (values for values, _ in rows()))
+        append = ws.append
+        cell = self._formatted_cell
+        append(header)
+        for values, fmts in rows():
+            get_fmt = fmts.get
+            append([cell(ws, v, get_fmt(c)) for c, v in enumerate(values, start=1)])
+
+    @staticmethod
+    def _formatted_cell(ws: Any, value: Any, fmt: str | None) -> Any:
+        if fmt is None:
+            return value
+        cell = WriteOnlyCell(ws, value=value)
+        cell.number_format = fmt
+        return cell
 
     def _autosize(
-        self, sheet: Worksheet, max_width: int = 60, min_width: int = 10
+        self,
+        sheet: Any,
+        header: list[str],
+        rows: Iterable[list[Any]],
+        max_width: int = 60,
+        min_width: int = 10,
     ) -> None:
-        header_values = [cell.value for cell in sheet[1]] if sheet.max_row else []
-        for col in range(1, sheet.max_column + 1):
-            max_len = 0
-            for row in range(1, sheet.max_row + 1):
-                v = sheet.cell(row=row, column=col).value
+        date_fmt = "%d/%m/%Y" if self.locale.upper() == "PT" else "%Y-%m-%d"
+        max_lens = [len(str(title)) for title in header]
+        ncols = len(header)
+        for values in rows:
+            for i in range(ncols):
+                v = values[i]
                 if v is None:
                     continue
                 # Approximate display width using string conversion
-                if hasattr(v, "strftime"):
-                    s = (
-                        v.strftime("%d/%m/%Y")
-                        if self.locale.upper() == "PT"
-                        else v.strftime("%Y-%m-%d")
-                    )
-                else:
-                    s = str(v)
-                if len(s) > max_len:
-                    max_len = len(s)
-            header = header_values[col - 1] if col - 1 < len(header_values) else None
-            if header:
-                max_len = max(max_len, len(str(header)))
-            width = min(max_width, max(min_width, max_len + 2))
-            if header and "JSON" in str(header):
+                n = len(v.strftime(date_fmt) if hasattr(v, "strftime") else str(v))
+                if n > max_lens[i]:
+                    max_lens[i] = n
+        for col, title in enumerate(header, start=1):
+            width = min(max_width, max(min_width, max_lens[col - 1] + 2))
+            if title and "JSON" in str(title):
                 width = min(width, 50)
             sheet.column_dimensions[get_column_letter(col)].width = width
 
@@ -0,0 +1,270 @@
+import datetime as dt
+from dataclasses import fields
+from decimal import Decimal
+
+import pytest
+
+from capitangains.cmd import cli
+from capitangains.cmd.cli import (
+    _event_sort_key,
+    build_argparser,
+    find_reconciliation_mismatches,
+    match_events,
+    parse_inputs,
+    process_files,
+)
+from capitangains.model import IbkrStatementCsvParser
+from capitangains.reporting.extract import TradeRow, TransferRow
+from capitangains.reporting.fifo import FifoMatcher
+from capitangains.reporting.report_builder import ReportBuilder
+from capitangains.reporting.report_sink import ExcelReportSink
+
+
+def _trade(datetime_str: str, quantity: str, proceeds: str) -> TradeRow:
+    return TradeRow(
+        section="Trades",
+        asset_category="Stocks",
+        currency="USD",
+        symbol="AAPL",
+        datetime_str=datetime_str,
+        date=dt.date.fromisoformat(datetime_str.split(",")[0]),
+        quantity=Decimal(quantity),
+        t_price=Decimal("10"),
+        proceeds=Decimal(proceeds),
+        comm_fee=Decimal("0"),
+        code="",
+    )
+
+
+_TRADES_HEADER = (
+    "Trades,Header,DataDiscriminator,Asset Category,Currency,Symbol,Date/Time,"
+    "Quantity,T. Price,Proceeds,Comm/Fee,Basis,Realized P/L,Code\n"
+)
+
+
+def _trade_line(when: str, quantity: int, price: int) -> str:
+    proceeds = -quantity * price
+    return (
+        f'Trades,Data,Order,Stocks,USD,AAPL,"{when}, 10:00:00",'
+        f"{quantity},{price},{proceeds},-1,,,\n"
+    )
+
+
+def _write_statement(tmp_path, name: str, body: str) -> str:
+    path = tmp_path / name
+    path.write_text(body, encoding="utf-8")
+    return str(path)
+
+
+def _run_process_files(monkeypatch, tmp_path, argv: list[str]) -> ReportBuilder:
+    """Run process_files and return the report handed to the sink."""
+    written: list[ReportBuilder] = []
+
+    def capture(self, report):
+        written.append(report)
+        return self.out_path
+
+    monkeypatch.setattr(ExcelReportSink, "write", capture)
+    out = str(tmp_path / "out.xlsx")
+    process_files(build_argparser().parse_args(["--output", out, *argv]))
+    assert len(written) == 1
+    return written[0]
+
+
+def _transfer(date: dt.date, direction: str, quantity: str) -> TransferRow:
+    return TransferRow(
+        section="Transfers",
+        asset_category="Stocks",
+        currency="USD",
+        symbol="AAPL",
+        date=date,
+        direction=direction,
+        quantity=Decimal(quantity),
+        market_value=Decimal("500"),
+        code="",
+    )
+
+
+def test_match_events_dispatches_trades_and_transfers():
+    events: list[TradeRow | TransferRow] = [
+        _transfer(dt.date(2024, 1, 2), "In", "50"),
+        _trade("2024-02-01, 10:00:00", "50", "-1000"),
+        _trade("2024-03-01, 10:00:00", "-80", "1600"),
+    ]
+    events.sort(key=_event_sort_key)
+
+    realized = match_events(FifoMatcher(), events)
+
+    assert len(realized) == 1
+    rl = realized[0]
+    assert rl.sell_qty == Decimal("80")
+    assert [leg.transferred for leg in rl.legs] == [True, False]
+    assert rl.realized_pl_ccy == Decimal("1600") - Decimal("500") - Decimal("600")
+
+
+def test_match_events_keeps_only_sells_in_year():
+    events: list[TradeRow | TransferRow] = [
+        _trade("2023-02-01, 10:00:00", "100", "-1000"),
+        _trade("2023-06-01, 10:00:00", "-40", "800"),
+        _trade("2024-03-01, 10:00:00", "-60", "1200"),
+    ]
+
+    realized = match_events(FifoMatcher(), events, year=2024)
+
+    assert [rl.sell_date for rl in realized] == [dt.date(2024, 3, 1)]
+    assert realized[0].sell_qty == Decimal("60")
+
+
+def test_match_events_accepts_event_subclasses():
+    class TaggedTrade(TradeRow):
+        pass
+
+    class TaggedTransfer(TransferRow):
+        pass
+
+    base_transfer = _transfer(dt.date(2024, 1, 2), "In", "50")
+    base_sell = _trade("2024-03-01, 10:00:00", "-50", "1000")
+    events: list[TradeRow | TransferRow] = [
+        TaggedTransfer(
+            **{f.name: getattr(base_transfer, f.name) for f in fields(base_transfer)}
+        ),
+        TaggedTrade(**{f.name: getattr(base_sell, f.name) for f in fields(base_sell)}),
+    ]
+
+    realized = match_events(FifoMatcher(), events)
+
+    assert len(realized) == 1
+    assert realized[0].sell_qty == Decimal("50")
+
+
+def test_match_events_rejects_unknown_event_type():
+    with pytest.raises(ValueError, match="unexpected event type"):
+        match_events(FifoMatcher(), [object()])  # type: ignore[list-item]
+
+
+def test_parse_inputs_preserves_input_order(tmp_path):
+    paths = []
+    for year in (2023, 2024):
+        path = tmp_path / f"stmt_{year}.csv"
+        path.write_text(
+            "Dividends,Header,Currency,Date,Description,Amount\n"
+            f"Dividends,Data,EUR,{year}-05-01,Div {year},1.00\n",
+            encoding="utf-8",
+        )
+        paths.append(str(path))
+
+    results = parse_inputs(IbkrStatementCsvParser(), paths)
+
+    descriptions = [
+        row["Description"]
+        for model, _report in results
+        for row in model.iter_rows("Dividends")
+    ]
+    assert descriptions == ["Div 2023", "Div 2024"]
+
+
+def test_find_reconciliation_mismatches_flags_only_out_of_threshold():
+    mine = {"AAA": Decimal("100.00"), "BBB": Decimal("50.00")}
+    ibkr = {
+        "AAA": Decimal("100.05"),
+        "BBB": Decimal("49.90"),
+        "CCC": Decimal("1.00"),
+    }
+
+    mismatches = find_reconciliation_mismatches(mine, ibkr)
+
+    assert mismatches == [("BBB", Decimal("50.00"), Decimal("49.90"))]
+
+
+def test_process_files_parses_several_inputs_and_applies_fx(tmp_path, monkeypatch):
+    fx_path = _write_statement(
+        tmp_path,
+        "fx.csv",
+        "date,currency,rate\n2023-05-01,USD,1.25\n2024-05-01,USD,1.00\n",
+    )
+    inputs = [
+        _write_statement(
+            tmp_path,
+            "stmt_2023.csv",
+            _TRADES_HEADER + _trade_line("2023-05-01", 10, 100),
+        ),
+        _write_statement(
+            tmp_path,
+            "stmt_2024.csv",
+            _TRADES_HEADER + _trade_line("2024-05-01", -10, 150),
+        ),
+    ]
+
+    rb = _run_process_files(
+        monkeypatch, tmp_path, ["--year", "2024", "--fx-table", fx_path, *inputs]
+    )
+
+    assert len(rb.realized_lines) == 1
+    rl = rb.realized_lines[0]
+    assert rl.sell_qty == Decimal("10")
+    # Buy leg converted at the 2023 rate, sell at the 2024 rate
+    assert rl.alloc_cost_eur == Decimal("800.80")
+    assert rl.sell_gross_eur == Decimal("1500.00")
+
+
+def test_process_files_ignores_gaps_after_report_year(tmp_path, monkeypatch):
+    fx_path = _write_statement(
+        tmp_path, "fx.csv", "date,currency,rate\n2023-01-02,USD,1.00\n"
+    )
+    stmt = _write_statement(
+        tmp_path,
+        "stmt.csv",
+        _TRADES_HEADER
+        + _trade_line("2023-05-01", 10, 100)
+        + _trade_line("2024-05-01", -4, 150)
+        # Sells more than is held, but only after the report year
+        + _trade_line("2025-02-01", -50, 150)
+        + "Open Positions,Header,Asset Category,Symbol,Quantity\n"
+        + "Open Positions,Data,Stocks,AAPL,6\n"
+        + "Realized & Unrealized Performance Summary,Header,Asset Category,Symbol,"
+        + "Realized Total\n"
+        + "Realized & Unrealized Performance Summary,Data,Stocks,AAPL,195\n"
+        + "Realized & Unrealized Performance Summary,Data,Stocks,MSFT,10\n",
+    )
+
+    models = []
+    merge_models = cli.merge_models
+
+    def capture_models(parsed):
+        models.append(merge_models(parsed))
+        return models[-1]
+
+    reconcile_calls = []
+    reconcile = cli.reconcile_with_ibkr_summary
+
+    def spy_reconcile(model, symbols=None):
+        reconcile_calls.append(set(symbols or ()))
+        return reconcile(model, symbols=symbols)
+
+    monkeypatch.setattr(cli, "merge_models", capture_models)
+    monkeypatch.setattr(cli, "reconcile_with_ibkr_summary", spy_reconcile)
+
+    rb = _run_process_files(
+        monkeypatch, tmp_path, ["--year", "2024", "--fx-table", fx_path, stmt]
+    )
+
+    assert [rl.sell_date for rl in rb.realized_lines] == [dt.date(2024, 5, 1)]
+    # Only the sections the extractors and reconciliation read are parsed
+    assert "Open Positions" not in models[0].sections
+    assert set(models[0].sections) <= cli.CONSUMED_SECTIONS
+    # Reconciliation is restricted to symbols with realized lines
+    assert reconcile_calls == [{"AAPL"}]
+
+    # Nothing is realized in 2023, so reconciliation is skipped altogether
+    rb = _run_process_files(
+        monkeypatch, tmp_path, ["--year", "2023", "--fx-table", fx_path, stmt]
+    )
+    assert rb.realized_lines == []
+    assert reconcile_calls == [{"AAPL"}]
+
+    # The gap still aborts the run for the year it falls in
+    with pytest.raises(SystemExit) as excinfo:
+        _run_process_files(
+            monkeypatch, tmp_path, ["--year", "2025", "--fx-table", fx_path, stmt]
+        )
+    assert excinfo.value.code == 2
@@ -1,9 +1,10 @@
+import datetime as dt
 import logging
 from decimal import Decimal
 
 import pytest
 
-from capitangains.conv import to_dec, to_dec_strict
+from capitangains.conv import parse_date, to_dec, to_dec_strict
 
 
 def test_to_dec_standard():
@@ -15,6 +16,11 @@ def test_to_dec_standard():
     assert to_dec(Decimal("5.5")) == Decimal("5.5")
 
 
+def test_to_dec_strips_unicode_whitespace_separators():
+    assert to_dec("1\u00a0234,567.5") == Decimal("1234567.5")
+    assert to_dec_strict("-2\u202f000.25") == Decimal("-2000.25")
+
+
 def test_to_dec_placeholders_silent():
     # These should return default (0) without logging warning
     assert to_dec(None) == Decimal("0")
@@ -103,3 +109,28 @@ def test_to_dec_strict_scientific_notation():
     # Decimal supports scientific notation, verify it passes
     assert to_dec_strict("1.5E2") == Decimal("150")
     assert to_dec_strict("1E-2") == Decimal("0.01")
+
+
+def test_parse_date_memoizes_and_still_raises():
+    first = parse_date("2024-03-01, 09:30:00")
+    assert first == dt.date(2024, 3, 1)
+    assert parse_date("2024-03-01, 09:30:00") is first
+    with pytest.raises(ValueError):
+        parse_date("not-a-date")
+
+
+def test_to_dec_strict_memoizes_strings_but_not_other_types():
+    first = to_dec_strict("1,234.50")
+    assert to_dec_strict("1,234.50") is first
+    # Equal-but-distinct Decimal inputs keep their own exponent
+    assert str(to_dec_strict(Decimal("1.0"))) == "1.0"
+    assert str(to_dec_strict(Decimal("1"))) == "1"
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            to_dec_strict("N/A")
+
+
+def test_parse_date_shares_dates_across_timestamps():
+    morning = parse_date("2024-03-04, 09:30:00")
+    assert parse_date("2024-03-04, 15:59:59") is morning
+    assert parse_date("2024-03-04") is morning
@@ -158,6 +158,54 @@ def test_parse_dividends_and_withholding_classification():
     assert withholding[1].type == "Interest"
 
 
+def test_parse_withholding_type_precedence():
+    descs = [
+        "USD Credit Interest for Dividend Account - US Tax",
+        "XYZ(US0000000000) Payment in Lieu of Dividend - US Tax",
+        "ABC Interest Dividend - US Tax",
+        "USD Debit Interest - US Tax",
+        "Something Else - US Tax",
+    ]
+    rows = [["Withholding Tax", "Header", "Currency", "Date", "Description", "Amount"]]
+    rows += [["Withholding Tax", "Data", "USD", "2024-01-05", d, "-1"] for d in descs]
+    model = _parse_rows(rows)
+
+    types = [w.type for w in parse_withholding_tax(model)]
+    assert types == ["Interest", "Dividend", "Dividend", "Interest", "Unknown"]
+
+
+def test_parse_withholding_country_suffix_variants():
+    rows = [
+        ["Withholding Tax", "Header", "Currency", "Date", "Description", "Amount"],
+        ["Withholding Tax", "Data", "USD", "2024-01-05", "Div - US Tax", "-1"],
+        ["Withholding Tax", "Data", "EUR", "2024-01-05", "Div -  NL\tTax", "-1"],
+        ["Withholding Tax", "Data", "USD", "2024-01-05", "Div - us Tax", "-1"],
+        ["Withholding Tax", "Data", "USD", "2024-01-05", "Div - CA Tax - FR Tax", "-1"],
+    ]
+    model = _parse_rows(rows)
+
+    countries = [w.country for w in parse_withholding_tax(model)]
+    # Non-canonical spacing falls back to the regex, which keeps the first match
+    assert countries == ["US", "NL", "", "CA"]
+
+
+def test_parse_dividends_and_withholding_year_filter():
+    rows = [
+        ["Dividends", "Header", "Currency", "Date", "Description", "Amount"],
+        ["Dividends", "Data", "USD", "2023-12-29", "Old Div", "..."],
+        ["Dividends", "Data", "USD", "2024-01-05", "New Div", "10.00"],
+        ["Withholding Tax", "Header", "Currency", "Date", "Description", "Amount"],
+        ["Withholding Tax", "Data", "USD", "2023-12-29", "Old - US Tax", "..."],
+        ["Withholding Tax", "Data", "USD", "2024-01-05", "Div - US Tax", "-1.50"],
+    ]
+    model = _parse_rows(rows)
+
+    # Out-of-year rows are skipped before their (elided) amounts are parsed
+    assert [d.description for d in parse_dividends(model, year=2024)] == ["New Div"]
+    withholding = parse_withholding_tax(model, year=2024)
+    assert [w.date for w in withholding] == [dt.date(2024, 1, 5)]
+
+
 def test_parse_syep_interest_skips_totals_and_coerces_numbers():
     rows = [
         [
@@ -213,6 +261,40 @@ def test_parse_syep_interest_skips_totals_and_coerces_numbers():
     assert row.value_date == dt.date(2024, 2, 1)
 
 
+def test_parse_syep_interest_and_interest_year_filter():
+    section = "Stock Yield Enhancement Program Securities Lent Interest Details"
+    numbers = ["-100", "1000", "0.1", "0.05", "1.23", "Po"]
+    rows = [
+        [
+            section,
+            "Header",
+            "Currency",
+            "Value Date",
+            "Symbol",
+            "Start Date",
+            "Quantity",
+            "Collateral Amount",
+            "Market-based Rate (%)",
+            "Interest Rate on Customer Collateral (%)",
+            "Interest Paid to Customer",
+            "Code",
+        ],
+        [section, "Data", "USD", "2024-02-01", "ABC", "", *numbers],
+        [section, "Data", "USD", "", "ABC", "", *numbers],
+        [section, "Data", "USD", "2023-12-01", "ABC", "", "", "", "", "", "", ""],
+        ["Interest", "Header", "Currency", "Date", "Description", "Amount"],
+        ["Interest", "Data", "USD", "2023-12-05", "Old Interest", "..."],
+        ["Interest", "Data", "USD", "2024-02-05", "New Interest", "1.23"],
+    ]
+    model = _parse_rows(rows)
+
+    # Rows without a value date or from other years are dropped before validation
+    syep = parse_syep_interest_details(model, year=2024)
+    assert [r.value_date for r in syep] == [dt.date(2024, 2, 1)]
+    interest = parse_interest(model, year=2024)
+    assert [r.description for r in interest] == ["New Interest"]
+
+
 def test_parse_interest_skips_totals():
     rows = [
         ["Interest", "Header", "Currency", "Date", "Description", "Amount"],
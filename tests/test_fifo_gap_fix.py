@@ -12,10 +12,7 @@ from capitangains.reporting.report_builder import ReportBuilder
 def _make_fx(rates: dict[tuple[str, str], Decimal]) -> FxTable:
     ft = FxTable()
     for (ccy, d), v in rates.items():
-        c = ccy.upper()
-        ft.data[c][d] = v
-    for c, m in ft.data.items():
-        ft.date_index[c] = sorted(m.keys())
+        ft.add_rate(dt.date.fromisoformat(d), ccy, v)
     return ft
 
 
@@ -109,6 +106,7 @@ def test_fifo_auto_fix_creates_synthetic_leg_and_matches_basis():
     # Residual cost brings total alloc to 1200
     total_alloc = rl.legs[0].alloc_cost_ccy + synth.alloc_cost_ccy
     assert total_alloc == Decimal("1200.00000000")
+    assert rl.alloc_cost_ccy == total_alloc
     # Realized matches IBKR per-trade: 1200 net - 1200 alloc = 0.00
     assert rl.realized_pl_ccy == Decimal("0.00")
 
@@ -40,6 +40,48 @@ def test_fx_from_csv_rejects_missing_columns(tmp_path):
         FxTable.from_csv(path)
 
 
+def test_fx_from_csv_reordered_columns_and_blank_lines(tmp_path):
+    path = tmp_path / "fx_reordered.csv"
+    path.write_text(
+        "rate,source,currency,date\n1.25,ecb,USD,2024-01-01\n\n0.85,ecb,GBP,2024-01-01\n",
+        encoding="utf-8",
+    )
+    table = FxTable.from_csv(path)
+    assert table.get_rate(dt.date(2024, 1, 1), "USD") == Decimal("1") / Decimal("1.25")
+    assert table.get_rate(dt.date(2024, 1, 1), "GBP") == Decimal("1") / Decimal("0.85")
+
+
+def test_fx_from_csv_rejects_short_row(tmp_path):
+    path = tmp_path / "fx_short.csv"
+    path.write_text("date,currency,rate\n2024-01-01,USD\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        FxTable.from_csv(path)
+
+
+def test_fx_from_csv_strips_padded_dates(tmp_path):
+    path = tmp_path / "fx_padded.csv"
+    path.write_text(
+        "date,currency,rate\n2024-01-03 ,USD,1.2\n 2024-01-04,USD,1.25\n",
+        encoding="utf-8",
+    )
+    table = FxTable.from_csv(path)
+    assert table.get_rate(dt.date(2024, 1, 3), "USD") == Decimal("1") / Decimal("1.2")
+    assert table.has_rate_exact(dt.date(2024, 1, 4), "USD") is True
+
+
+def test_fx_from_csv_skips_malformed_dates(tmp_path, caplog):
+    path = tmp_path / "fx_malformed.csv"
+    path.write_text(
+        "date,currency,rate\n03/01/2024,USD,1.1\n2024-01-02,USD,1.2\n",
+        encoding="utf-8",
+    )
+    with caplog.at_level("WARNING", logger="capitangains.reporting.fx"):
+        table = FxTable.from_csv(path)
+    assert table.get_rate(dt.date(2024, 1, 2), "USD") == Decimal("1") / Decimal("1.2")
+    assert table.get_rate(dt.date(2024, 1, 1), "USD") is None
+    assert "invalid date" in caplog.text
+
+
 def test_fx_from_csv_rejects_zero_rate(tmp_path):
     path = _write_csv(tmp_path, [["2024-01-01", "USD", "0"]])
     with pytest.raises(ValueError):
@@ -65,3 +107,65 @@ def test_fx_get_rate_unknown_currency():
     assert table.get_rate(dt.date(2024, 1, 1), "JPY") is None
     assert table.has_rate_exact(dt.date(2024, 1, 1), "JPY") is False
     assert table.get_rate(dt.date(2024, 1, 1), "EUR") == Decimal("1")
+
+
+def test_fx_add_rate_keeps_dates_sorted_and_overwrites_duplicates():
+    table = FxTable()
+    table.add_rate(dt.date(2024, 1, 10), "usd", Decimal("0.90"))
+    table.add_rate(dt.date(2024, 1, 2), "USD", Decimal("0.80"))
+    table.add_rate(dt.date(2024, 1, 10), "USD", Decimal("0.95"))
+
+    assert table.get_rate(dt.date(2024, 1, 1), "USD") is None
+    assert table.get_rate(dt.date(2024, 1, 5), "USD") == Decimal("0.80")
+    assert table.get_rate(dt.date(2024, 1, 10), "USD") == Decimal("0.95")
+    assert table.has_rate_exact(dt.date(2024, 1, 2), "USD") is True
+    assert table.has_rate_exact(dt.date(2024, 1, 5), "USD") is False
+
+
+def test_fx_from_csv_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    path = _write_csv(tmp_path, [["2024-01-01", "USD", "1.25"]])
+    first = FxTable.from_csv(path)
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    real = FxTable._from_csv_uncached
+
+    def counting(cls, p):
+        calls.append(p)
+        return real(p)
+
+    monkeypatch.setattr(FxTable, "_from_csv_uncached", classmethod(counting))
+
+    # A relative path to the same file hits the same cache entry
+    again = FxTable.from_csv("fx.csv")
+    assert calls == []
+    assert again is not first
+    assert again.get_rate(dt.date(2024, 1, 1), "USD") == first.get_rate(
+        dt.date(2024, 1, 1), "USD"
+    )
+
+    path = _write_csv(
+        tmp_path,
+        [["2024-01-01", "USD", "1.25"], ["2024-01-02", "USD", "1.50"]],
+    )
+    reloaded = FxTable.from_csv(path)
+    assert len(calls) == 1
+    assert reloaded.has_rate_exact(dt.date(2024, 1, 2), "USD") is True
+
+
+def test_fx_from_csv_returns_independent_tables(tmp_path):
+    path = _write_csv(tmp_path, [["2024-01-01", "USD", "1.25"]])
+    first = FxTable.from_csv(path)
+    first.add_rate(dt.date(2024, 1, 2), "USD", Decimal("0.5"))
+
+    second = FxTable.from_csv(path)
+    assert second.has_rate_exact(dt.date(2024, 1, 2), "USD") is False
+    assert second.get_rate(dt.date(2024, 1, 2), "USD") == Decimal("1") / Decimal("1.25")
+
+
+def test_fx_get_rate_memo_is_invalidated_by_add_rate():
+    table = FxTable()
+    table.add_rate(dt.date(2024, 1, 2), "USD", Decimal("0.80"))
+    assert table.get_rate(dt.date(2024, 1, 5), "USD") == Decimal("0.80")
+
+    table.add_rate(dt.date(2024, 1, 4), "USD", Decimal("0.85"))
+    assert table.get_rate(dt.date(2024, 1, 5), "USD") == Decimal("0.85")
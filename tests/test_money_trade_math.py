@@ -27,6 +27,14 @@ def test_round_cost_piece_proportional_allocation():
     assert round_cost_piece(total_basis, take, lot_qty) == Decimal("25.00000000")
 
 
+def test_round_cost_piece_whole_lot_matches_proportional_path():
+    total_basis = Decimal("1234.567890123")
+    lot_qty = Decimal("7")
+    piece = round_cost_piece(total_basis, lot_qty, lot_qty)
+    assert piece == quantize_allocation(total_basis * (lot_qty / lot_qty))
+    assert str(piece) == "1234.56789012"
+
+
 def test_round_cost_piece_handles_zero_qty_lot():
     assert round_cost_piece(Decimal("100"), Decimal("10"), Decimal("0")) == Decimal("0")
 
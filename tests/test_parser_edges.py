@@ -1,6 +1,10 @@
 from decimal import Decimal
 
-from capitangains.model.ibkr import IbkrStatementCsvParser
+from capitangains.model.ibkr import (
+    IbkrStatementCsvParser,
+    merge_models,
+    merge_reports,
+)
 
 
 def test_parser_bom_and_data_before_header():
@@ -53,3 +57,40 @@ def test_total_and_subtotal_rows_are_silently_skipped():
         {"Currency": "EUR", "Symbol": "ASML", "Quantity": "10"},
     ]
     assert not report.issues
+
+
+def test_parser_only_materializes_requested_sections():
+    rows = [
+        ["Statement", "Header", "Field Name", "Field Value"],
+        ["Statement", "Data", "Period", "2024"],
+        ["Dividends", "Header", "Currency", "Date", "Description", "Amount"],
+        ["Dividends", "Data", "EUR", "2024-01-05", "Test Div", "10.00"],
+        ["Open Positions", "Header", "Symbol", "Quantity"],
+        ["Open Positions", "Data", "ASML", "10"],
+        ["Trades", "Data", "EUR", "ASML"],
+    ]
+    parser = IbkrStatementCsvParser(sections={"Dividends"})
+    model, report = parser.parse_rows(rows)
+
+    assert list(model.sections) == ["Dividends"]
+    assert len(list(model.iter_rows("Dividends"))) == 1
+    # Structural errors in skipped sections are still reported
+    assert [i.line_no for i in report.issues] == [7]
+
+
+def test_merge_models_and_reports():
+    parser = IbkrStatementCsvParser()
+    m1, r1 = parser.parse_rows(
+        [["Trades", "Header", "Symbol"], ["Trades", "Data", "A"]]
+    )
+    m2, r2 = parser.parse_rows(
+        [["Trades", "Header", "Symbol"], ["Trades", "Data", "B"]]
+    )
+    r2.warn(1, "note")
+
+    assert merge_models([m1]) is m1
+    assert merge_reports([r1]) is r1
+
+    merged = merge_models([m1, m2])
+    assert [r["Symbol"] for r in merged.iter_rows("Trades")] == ["A", "B"]
+    assert len(merge_reports([r1, r2]).issues) == 1
@@ -137,3 +137,34 @@ def test_reconcile_returns_empty_when_missing_columns():
     model = _parse_rows(rows)
 
     assert reconcile_with_ibkr_summary(model) == {}
+
+
+def test_reconcile_restricts_to_requested_symbols():
+    rows = [
+        [
+            "Realized & Unrealized Performance Summary",
+            "Header",
+            "Asset Category",
+            "Symbol",
+            "Total",
+        ],
+        [
+            "Realized & Unrealized Performance Summary",
+            "Data",
+            "Stocks",
+            "ABC",
+            "1.00",
+        ],
+        [
+            "Realized & Unrealized Performance Summary",
+            "Data",
+            "Stocks",
+            "XYZ",
+            "2.00",
+        ],
+    ]
+    model = _parse_rows(rows)
+
+    assert reconcile_with_ibkr_summary(model, symbols={"XYZ"}) == {
+        "XYZ": Decimal("2.00")
+    }
@@ -1,4 +1,5 @@
 import datetime as dt
+import json
 from decimal import Decimal
 from typing import Any
 
@@ -16,15 +17,13 @@ from capitangains.reporting.extract import (
 from capitangains.reporting.fifo_domain import RealizedLine, SellMatchLeg
 from capitangains.reporting.fx import FxTable
 from capitangains.reporting.report_builder import ReportBuilder
-from capitangains.reporting.report_sink import ExcelReportSink
+from capitangains.reporting.report_sink import ExcelReportSink, _legs_json
 
 
 def _make_fx(rates):
     table = FxTable()
     for (ccy, date), value in rates.items():
-        table.data[ccy][date] = value
-    for ccy, m in table.data.items():
-        table.date_index[ccy] = sorted(m.keys())
+        table.add_rate(dt.date.fromisoformat(date), ccy, value)
     return table
 
 
@@ -43,6 +42,7 @@ def _realized(
     sell_qty = sum((leg.qty for leg in leg_objs), Decimal("0"))
     sell_net = Decimal("100")
     sell_gross = sell_net
+    alloc_cost = sum((leg.alloc_cost_ccy for leg in leg_objs), Decimal("0"))
     return RealizedLine(
         symbol=symbol,
         currency=currency,
@@ -52,8 +52,8 @@ def _realized(
         sell_comm_ccy=Decimal("0"),
         sell_net_ccy=sell_net,
         legs=leg_objs,
-        realized_pl_ccy=sell_net
-        - sum((leg.alloc_cost_ccy for leg in leg_objs), Decimal("0")),
+        realized_pl_ccy=sell_net - alloc_cost,
+        alloc_cost_ccy=alloc_cost,
     )
 
 
@@ -157,6 +157,7 @@ def test_report_builder_convert_eur_handles_missing_fx_and_leg_fallback():
             )
         ],
         realized_pl_ccy=Decimal("0"),
+        alloc_cost_ccy=Decimal("0"),
     )
     rb.add_realized(zero_qty_rl)
     rb.convert_eur(fx)
@@ -391,3 +392,32 @@ def test_excel_report_sink_sorts_withholding(tmp_path):
         for i in range(2, ws.max_row + 1)
     ]
     assert rows == sorted(rows, key=lambda r: (r[0], r[1]))
+
+
+def test_legs_json_matches_json_dumps():
+    legs = [
+        SellMatchLeg(
+            buy_date=dt.date(2023, 1, 1),
+            qty=Decimal("10"),
+            lot_qty_before=Decimal("10"),
+            alloc_cost_ccy=Decimal("800.00000000"),
+        ),
+        SellMatchLeg(
+            buy_date=None,
+            qty=Decimal("0.5"),
+            lot_qty_before=Decimal("0"),
+            alloc_cost_ccy=Decimal("-1E-8"),
+        ),
+    ]
+    expected = json.dumps(
+        [
+            {
+                "buy_date": leg.buy_date.isoformat() if leg.buy_date else None,
+                "qty": str(leg.qty),
+                "alloc_cost_ccy": str(leg.alloc_cost_ccy),
+            }
+            for leg in legs
+        ]
+    )
+    assert _legs_json(legs) == expected
+    assert _legs_json([]) == json.dumps([])
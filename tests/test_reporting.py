@@ -21,10 +21,7 @@ def make_fx(rates: dict[tuple[str, str], Decimal]) -> FxTable:
     ft = FxTable()
     # rates: {(currency, yyyy-mm-dd): eur_per_unit}
     for (ccy, d), v in rates.items():
-        c = ccy.upper()
-        ft.data[c][d] = v
-    for c, m in ft.data.items():
-        ft.date_index[c] = sorted(m.keys())
+        ft.add_rate(dt.date.fromisoformat(d), ccy, v)
     return ft
 
 
@@ -188,6 +185,7 @@ def test_per_symbol_summary_trade_and_eur(tmp_path):
         sell_net_ccy=Decimal("1000"),
         legs=legs,
         realized_pl_ccy=Decimal("200.00"),
+        alloc_cost_ccy=Decimal("800"),
     )
     rb.add_realized(rl)
 
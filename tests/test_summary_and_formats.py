@@ -13,9 +13,8 @@ from capitangains.reporting.report_sink import ExcelReportSink
 def make_fx() -> FxTable:
     ft = FxTable()
     # EUR identity is handled internally; add USD for a couple dates
-    ft.data["USD"]["2024-01-10"] = Decimal("0.9")
-    ft.data["USD"]["2024-01-05"] = Decimal("0.9")
-    ft.date_index["USD"] = sorted(ft.data["USD"].keys())
+    ft.add_rate(dt.date(2024, 1, 10), "USD", Decimal("0.9"))
+    ft.add_rate(dt.date(2024, 1, 5), "USD", Decimal("0.9"))
     return ft
 
 
@@ -39,6 +38,7 @@ def build_rb_for_summary():
             )
         ],
         realized_pl_ccy=Decimal("199.00"),
+        alloc_cost_ccy=Decimal("800.00"),
     )
     rb.add_realized(rl_eur)
 
@@ -60,6 +60,7 @@ def build_rb_for_summary():
             )
         ],
         realized_pl_ccy=Decimal("100.00"),
+        alloc_cost_ccy=Decimal("400.00"),
     )
     rb.add_realized(rl_usd)
 